@@ -8,6 +8,7 @@ without the GUI.
 """
 
 import os
+import hashlib
 import logging
 import time
 from typing import Dict, Any, Optional, Tuple, List
@@ -36,6 +37,9 @@ class MultiTTSAPI:
     DEFAULT_SPEAKER_DIR = "./speaker_samples"
     DEFAULT_PIPER_MODEL_DIR = "models/piper"
 
+    # How long a successful key validation / voices fetch stays cached
+    ELEVENLABS_CACHE_TTL = 300
+
     def __init__(self):
         """Initialize the API and ensure output directories exist."""
         # Ensure output directory exists
@@ -46,6 +50,20 @@ class MultiTTSAPI:
         self._elevenlabs_voices = {}
         # Current validated ElevenLabs API key
         self._current_elevenlabs_key = None
+        # Validation and voices caches, keyed by a hash of the API key so
+        # the caches never hold the plaintext keys themselves.
+        # {key_hash: validated_at}
+        self._key_validation_cache: Dict[str, float] = {}
+        # {key_hash: (fetched_at, voices)}
+        self._voices_cache: Dict[str, Tuple[float, List[Tuple[str, str]]]] = {}
+        # Output directories already known to exist; avoids a stat syscall
+        # per synthesis call
+        self._known_dirs = {self.DEFAULT_OUTPUT_DIR}
+
+    @staticmethod
+    def _hash_key(api_key: str) -> str:
+        """Return a short BLAKE2b digest of an API key for cache lookups."""
+        return hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
 
     # --- XTTSv2 Methods ---
 
@@ -168,13 +186,21 @@ class MultiTTSAPI:
         Returns:
             True if valid, False otherwise
         """
+        key_hash = self._hash_key(api_key)
+        validated_at = self._key_validation_cache.get(key_hash)
+        if validated_at is not None and time.time() - validated_at < self.ELEVENLABS_CACHE_TTL:
+            self._current_elevenlabs_key = api_key
+            return True
+
         logger.info("Validating ElevenLabs API key")
         validated_key = elevenlabs_engine.validate_api_key(api_key)
 
         if validated_key:
+            self._key_validation_cache[key_hash] = time.time()
             self._current_elevenlabs_key = validated_key
             return True
         else:
+            self._key_validation_cache.pop(key_hash, None)
             return False
 
     def get_elevenlabs_voices(self, api_key: Optional[str] = None) -> List[Tuple[str, str]]:
@@ -195,8 +221,14 @@ class MultiTTSAPI:
         if not key_to_use:
             raise ValueError("No ElevenLabs API key provided or cached")
 
-        logger.info("Fetching ElevenLabs voices")
-        voices = elevenlabs_engine.get_elevenlabs_voices(key_to_use)
+        key_hash = self._hash_key(key_to_use)
+        cached = self._voices_cache.get(key_hash)
+        if cached and time.time() - cached[0] < self.ELEVENLABS_CACHE_TTL:
+            voices = cached[1]
+        else:
+            logger.info("Fetching ElevenLabs voices")
+            voices = elevenlabs_engine.get_elevenlabs_voices(key_to_use)
+            self._voices_cache[key_hash] = (time.time(), voices)
 
         # Cache the results for quick lookup
         self._elevenlabs_voices = {name: voice_id for name, voice_id in voices}
@@ -325,9 +357,12 @@ class MultiTTSAPI:
     def _ensure_output_dir_exists(self, output_path: str) -> None:
         """Ensure the output directory for a file exists."""
         output_dir = os.path.dirname(output_path)
-        if output_dir and not os.path.exists(output_dir):
+        if output_dir and output_dir not in self._known_dirs:
+            # A concurrent double-create is benign: makedirs is idempotent
+            # with exist_ok=True
             os.makedirs(output_dir, exist_ok=True)
-            logger.info(f"Created output directory: {output_dir}")
+            self._known_dirs.add(output_dir)
+            logger.info(f"Ensured output directory exists: {output_dir}")
 
     @property
     def available_models(self) -> Dict[str, str]:
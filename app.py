@@ -11,26 +11,50 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
 import os
+import hashlib
+import importlib
+import json
 import logging
+import re
+import shutil
+import sys
+import tempfile
 import time
 import glob
 import traceback
+import wave
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Tuple, Dict
 
 # --- Third-Party Imports ---
+# NOTE: deliberately no numba/JIT dependency here. The GUI has no hot numeric
+# loop — its costs are network I/O, engine inference and Tk calls — so a JIT
+# would only add seconds of import time without ever amortizing. Keep it out.
 import pygame         # For audio playback
 import soundfile as sf # For reading audio file duration (WAV)
 from dotenv import load_dotenv # For loading API keys from .env file
 
 # --- Local Imports ---
-# Import engine *synthesis functions* from the tts_engines package
-try:
-    from tts_engines import xtts_engine, piper_engine, bark_engine, elevenlabs_engine
-except ImportError as e:
-    print(f"ERROR: Could not import TTS engines. Error:\n{traceback.format_exc()}")
-    print("Ensure the 'tts_engines' directory exists alongside app.py and")
-    print("all required dependencies (TTS, piper-tts, transformers, elevenlabs, etc.) are installed.")
-    exit(1)
+# Engine modules are imported lazily via _engine() below: pulling in every
+# backend up front (TTS/torch, transformers, piper-tts, elevenlabs) costs
+# seconds of startup and hundreds of MB even for users who only ever touch
+# one engine.
+_ENGINES: Dict[str, object] = {}
+
+def _engine(name: str):
+    """Returns the tts_engines.<name>_engine module, importing it on first use."""
+    module = _ENGINES.get(name)
+    if module is None:
+        try:
+            module = importlib.import_module(f"tts_engines.{name}_engine")
+        except ImportError:
+            print(f"ERROR: Could not import TTS engine '{name}'. Error:\n{traceback.format_exc()}")
+            print("Ensure the 'tts_engines' directory exists alongside app.py and")
+            print("all required dependencies (TTS, piper-tts, transformers, elevenlabs, etc.) are installed.")
+            raise
+        _ENGINES[name] = module
+    return module
 
 # Import *engine UI creation functions* from the ui_engines package
 try:
@@ -58,9 +82,13 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - [GUI] %(message)s'
 )
+# Module logger; hot paths pass %-style args so the message is only
+# formatted when the level is actually enabled.
+logger = logging.getLogger(__name__)
 
 # --- Default Paths and Constants ---
 DEFAULT_OUTPUT_DIR = "audio_output"
+DEFAULT_OUTPUT_FILE = os.path.join(DEFAULT_OUTPUT_DIR, "output.wav")
 DEFAULT_SPEAKER_DIR = "speaker_samples"
 DEFAULT_PIPER_MODEL_DIR = "models/piper"
 DEFAULT_BARK_VOICES = [ # Keep this here as it's app-level config
@@ -71,8 +99,118 @@ DEFAULT_BARK_VOICES = [ # Keep this here as it's app-level config
     "v2/pl_speaker_1", "v2/pt_speaker_1", "v2/ru_speaker_1", "v2/tr_speaker_1",
     "v2/zh_speaker_1", "v2/nl_speaker_0", "v2/nl_speaker_1",
 ]
-# Get ElevenLabs models list from the engine module (still needed for dropdown)
-ELEVENLABS_MODELS = elevenlabs_engine.ELEVENLABS_MODELS if elevenlabs_engine else []
+# Membership set and default preset resolved once at import time instead of
+# scanning the list on every UI construction
+_BARK_VOICES_SET = frozenset(DEFAULT_BARK_VOICES)
+DEFAULT_BARK_PRESET = (
+    "v2/en_speaker_6" if "v2/en_speaker_6" in _BARK_VOICES_SET
+    else (DEFAULT_BARK_VOICES[0] if DEFAULT_BARK_VOICES else "")
+)
+# The ElevenLabs models list for the dropdown is resolved lazily from the
+# engine module when the ElevenLabs UI frame is built (see TTSApp.__init__).
+
+# Directory-existence checks for the browse dialogs, cached briefly.
+# Directories rarely appear or disappear mid-session, and on networked home
+# directories every isdir is a filesystem round-trip.
+# Module-level copies of the Tk state constants: handlers that run many times
+# a second (status updates, menu popups) load these with a fast global lookup
+# instead of a module-attribute lookup on tk each time.
+_TK_NORMAL = tk.NORMAL
+_TK_DISABLED = tk.DISABLED
+
+# Upper bound for the per-file duration cache (see TTSApp._duration_cache).
+_DURATION_CACHE_MAX = 256
+
+# Pastes larger than the threshold are inserted in idle-time slices of the
+# given size instead of one blocking insert (see TTSApp._chunked_paste).
+_PASTE_CHUNK_THRESHOLD = 50_000
+_PASTE_CHUNK_SIZE = 8 * 1024
+
+# Synthesis result cache: generated WAVs are kept under a hidden directory
+# keyed by a hash of (engine, text, parameters), so repeating the exact same
+# request reuses the file instead of re-running inference or burning
+# ElevenLabs quota. A periodic sweep keeps the directory bounded.
+_SYNTH_CACHE_DIR = os.path.join(DEFAULT_OUTPUT_DIR, ".cache")
+_SYNTH_CACHE_MAX_FILES = 500
+_SYNTH_CACHE_SWEEP_MS = 600_000  # 10 minutes
+
+# Chunked long-form synthesis: texts longer than this (with the checkbox on)
+# are split on sentence boundaries and synthesized chunk by chunk, so long
+# paragraphs show progress instead of one monolithic engine call.
+_LONGFORM_MIN_CHARS = 400
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+def _split_sentences(text: str) -> List[str]:
+    """Splits text on sentence boundaries for chunked long-form synthesis."""
+    return [s for s in _SENTENCE_SPLIT_RE.split(text) if s.strip()]
+
+# Path-valued params are folded into the cache key as (abspath, size, mtime)
+# instead of their contents: O(1) per key regardless of how large a speaker
+# WAV or model file is. Trade-off: editing such a file in place without
+# changing its size or mtime will not bust the cache.
+_SYNTH_CACHE_PATH_PARAMS = frozenset(('speaker_wav_path', 'model_onnx_path', 'model_json_path'))
+
+def _synth_cache_key(model_type: str, params: dict) -> str:
+    """Returns a stable hash identifying a synthesis request.
+
+    The output path and API key are excluded: neither changes what audio
+    the engine produces. File-path parameters contribute their stat
+    fingerprint rather than their bytes.
+    """
+    fingerprint = {}
+    for key, value in params.items():
+        if key in ('output_path', 'api_key'):
+            continue
+        if key in _SYNTH_CACHE_PATH_PARAMS and value:
+            try:
+                st = os.stat(value)
+                value = [os.path.abspath(value), st.st_size, st.st_mtime_ns]
+            except OSError:
+                pass  # Missing file: the raw path still keys deterministically.
+        fingerprint[key] = value
+    fingerprint['engine'] = model_type
+    payload = json.dumps(fingerprint, sort_keys=True).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+# Matches named ElevenLabs key env vars; the single C-level match replaces a
+# startswith + removeprefix pair per environment entry.
+_EL_KEY_RE = re.compile(r"^ELEVENLABS_API_KEY_(.+)$")
+
+def _audio_available() -> bool:
+    """Best-effort check for a usable audio backend before pygame touches it.
+
+    pygame.mixer.init() can hang for seconds probing a misconfigured
+    ALSA/PulseAudio stack. These checks cost microseconds and bail out
+    immediately on machines with no audio at all; anything inconclusive
+    still falls through to the normal pygame probe.
+    """
+    if os.environ.get("SDL_AUDIODRIVER") == "dummy":
+        return False
+    if sys.platform.startswith("linux"):
+        if os.environ.get("PULSE_SERVER") or os.environ.get("PIPEWIRE_RUNTIME_DIR"):
+            return True
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+        if runtime_dir and os.path.exists(os.path.join(runtime_dir, "pulse", "native")):
+            return True
+        try:  # Bare ALSA: any sound device at all?
+            with os.scandir("/dev/snd") as it:
+                return any(entry.name.startswith(("pcm", "controlC")) for entry in it)
+        except OSError:
+            return False
+    return True
+
+_ISDIR_TTL = 5.0  # seconds
+_isdir_cache: Dict[str, Tuple[float, bool]] = {}
+
+def _isdir_cached(path: str) -> bool:
+    """os.path.isdir with a short TTL cache."""
+    now = time.monotonic()
+    entry = _isdir_cache.get(path)
+    if entry is not None and now - entry[0] < _ISDIR_TTL:
+        return entry[1]
+    result = os.path.isdir(path)
+    _isdir_cache[path] = (now, result)
+    return result
 
 
 # --- Main Application Class ---
@@ -95,7 +233,7 @@ class TTSApp(tk.Tk):
     # --- Text Input Context Menu Methods (UNCHANGED) ---
     def _create_text_context_menu(self):
         """Creates the right-click context menu for the text input field."""
-        if not hasattr(self, 'text_context_menu'):
+        if self.text_context_menu is None:
             self.text_context_menu = tk.Menu(self, tearoff=0)
             self.text_context_menu.add_command(label="Undo (Ctrl+Z)", command=self._text_undo)
             self.text_context_menu.add_command(label="Redo (Ctrl+Y)", command=self._text_redo)
@@ -106,72 +244,173 @@ class TTSApp(tk.Tk):
             self.text_context_menu.add_separator()
             self.text_context_menu.add_command(label="Select All (Ctrl+A)", command=self._text_select_all)
 
+    def _clipboard_has_text_now(self):
+        """Returns True if the clipboard currently offers text.
+
+        Asks the clipboard owner for its TARGETS list first, which only
+        transfers the type names — not the data — so a huge clipboard
+        payload is never pulled across just to grey out a menu entry.
+        Falls back to clipboard_get where TARGETS is unsupported.
+        """
+        try:
+            targets = self.selection_get(selection="CLIPBOARD", type="TARGETS")
+        except tk.TclError:
+            pass
+        else:
+            return any(t in ("STRING", "UTF8_STRING", "TEXT") for t in targets.split())
+        try:
+            return bool(self.clipboard_get())
+        except tk.TclError:
+            return False
+
     def _show_text_context_menu(self, event):
         """Shows the text context menu at the mouse position and updates item states."""
-        if not hasattr(self, 'text_input') or not hasattr(self, 'text_context_menu'): return
+        if self.text_input is None or self.text_context_menu is None: return
         self.text_input.focus_set()
-        try: self.text_context_menu.entryconfig("Undo (Ctrl+Z)", state=tk.NORMAL)
-        except tk.TclError: pass
-        try: self.text_context_menu.entryconfig("Redo (Ctrl+Y)", state=tk.NORMAL)
-        except tk.TclError: pass
-        try:
-            has_selection = bool(self.text_input.tag_ranges(tk.SEL)); state = tk.NORMAL if has_selection else tk.DISABLED
-            self.text_context_menu.entryconfig("Cut", state=state); self.text_context_menu.entryconfig("Copy", state=state)
-        except tk.TclError: self.text_context_menu.entryconfig("Cut", state=tk.DISABLED); self.text_context_menu.entryconfig("Copy", state=tk.DISABLED)
-        try: self.clipboard_get(); self.text_context_menu.entryconfig("Paste", state=tk.NORMAL)
-        except tk.TclError: self.text_context_menu.entryconfig("Paste", state=tk.DISABLED)
-        try: self.text_context_menu.entryconfig("Select All (Ctrl+A)", state=tk.NORMAL)
-        except tk.TclError: pass
+        # Undo/Redo/Select All are created enabled and never change. Only
+        # Cut/Copy/Paste can flip, and each is reconfigured only when its
+        # state differs from the last popup — on slow X11 links every
+        # entryconfig is a round-trip, so most popups now issue none.
+        sel_state = _TK_NORMAL if self._sel_nonempty else _TK_DISABLED
+        desired = {
+            "Cut": sel_state,
+            "Copy": sel_state,
+            "Paste": _TK_NORMAL if self._clipboard_has_text_now() else _TK_DISABLED,
+        }
+        menu_cfg = self.text_context_menu.entryconfig
+        last = self._ctxmenu_last_states
+        for label, state in desired.items():
+            if last.get(label) != state:
+                try: menu_cfg(label, state=state)
+                except tk.TclError: continue
+                last[label] = state
         self.text_context_menu.tk_popup(event.x_root, event.y_root)
 
     def _text_cut(self):
-        if hasattr(self, 'text_input'):
+        if self.text_input is not None:
             try: self.text_input.event_generate("<<Cut>>")
             except tk.TclError: pass
     def _text_copy(self):
-        if hasattr(self, 'text_input'):
+        if self.text_input is not None:
             try: self.text_input.event_generate("<<Copy>>")
             except tk.TclError: pass
     def _text_paste(self):
-        if hasattr(self, 'text_input'):
+        if self.text_input is not None:
             try: self.text_input.event_generate("<<Paste>>")
             except tk.TclError: pass
+
+    def _chunked_paste(self, event=None):
+        """Feeds very large pastes into the text widget in idle-time chunks.
+
+        Pasting a novel-sized script in a single insert stalls Tk's
+        per-character tag/undo pipeline and freezes the window. Pastes over
+        the threshold are split into 8 KB slices inserted between idle
+        callbacks, grouped into one undo unit. Small pastes return None so
+        the default <<Paste>> class binding handles them as usual.
+        """
+        widget = self.text_input
+        if widget is None: return None
+        try:
+            text = self.clipboard_get()
+        except tk.TclError:
+            return "break"  # Empty or non-text clipboard.
+        if len(text) <= _PASTE_CHUNK_THRESHOLD:
+            return None
+        try:
+            sel = widget.tag_ranges(tk.SEL)
+            if sel: widget.delete(sel[0], sel[1])
+        except tk.TclError:
+            pass
+        # Suspend autoseparators so the whole paste undoes as one action,
+        # bracketed by explicit separators.
+        widget.edit_separator()
+        widget.configure(autoseparators=False)
+
+        def insert_chunk(offset=0):
+            if widget is not self.text_input: return  # Widget torn down.
+            chunk = text[offset:offset + _PASTE_CHUNK_SIZE]
+            if chunk:
+                widget.insert(tk.INSERT, chunk)
+                self.after_idle(insert_chunk, offset + _PASTE_CHUNK_SIZE)
+            else:
+                widget.configure(autoseparators=True)
+                widget.edit_separator()
+
+        insert_chunk()
+        return "break"
+
+    def _clear_ghost_once(self, event=None):
+        """Deletes the ghost placeholder span on first focus, then unbinds."""
+        widget = self.text_input
+        if widget is None: return
+        ranges = widget.tag_ranges("ghost")
+        if ranges:
+            widget.delete(ranges[0], ranges[1])
+            widget.edit_reset()
+        widget.unbind("<FocusIn>")
     def _text_select_all(self, event=None):
-        if hasattr(self, 'text_input'):
-            try: self.text_input.tag_add(tk.SEL, "1.0", tk.END); self.text_input.mark_set(tk.INSERT, "1.0"); self.text_input.see(tk.INSERT); return "break"
+        widget = event.widget if event is not None else self.text_input
+        if widget is not None:
+            try: widget.tag_add(tk.SEL, "1.0", tk.END); widget.mark_set(tk.INSERT, "1.0"); widget.see(tk.INSERT); return "break"
             except tk.TclError: pass
     def _text_undo(self, event=None):
-        if hasattr(self, 'text_input'):
-            try: self.text_input.edit_undo()
+        widget = event.widget if event is not None else self.text_input
+        if widget is not None:
+            try: widget.edit_undo()
             except tk.TclError: logging.info("Undo stack is empty."); return "break"
     def _text_redo(self, event=None):
-        if hasattr(self, 'text_input'):
-            try: self.text_input.edit_redo()
+        widget = event.widget if event is not None else self.text_input
+        if widget is not None:
+            try: widget.edit_redo()
             except tk.TclError: logging.info("Redo stack is empty."); return "break"
 
+    def _install_text_bindings(self):
+        """Installs the shared keyboard/context-menu bindings for Text widgets.
+
+        bind_class registers one Tcl callback on the Text class instead of
+        one per widget instance, so every Text widget shares the same
+        binding-table entry and new Text widgets pick the bindings up for
+        free. The handlers act on event.widget rather than a hard-coded
+        widget for the same reason.
+        """
+        self.bind_class("Text", "<Button-3>", self._show_text_context_menu)
+        for sequence, handler in (
+            ("<Control-a>", self._text_select_all), ("<Control-A>", self._text_select_all),
+            ("<Control-z>", self._text_undo), ("<Control-Z>", self._text_undo),
+            ("<Control-y>", self._text_redo), ("<Control-Y>", self._text_redo),
+        ):
+            self.bind_class("Text", sequence, handler)
+
     # --- General UI Helper Methods (UNCHANGED, except browse_file/save usage) ---
     def update_parameter_ui(self, event=None):
-        """Shows/hides the appropriate parameter frame based on model selection."""
-        selected_model = self.model_choice.get()
-        logging.info(f"Switching parameter view to: {selected_model}")
+        """Raises the parameter frame matching the selected model.
 
-        # Hide all parameter frames first, checking if they exist
-        if hasattr(self, 'xtts_frame') and self.xtts_frame: self.xtts_frame.pack_forget()
-        if hasattr(self, 'piper_frame') and self.piper_frame: self.piper_frame.pack_forget()
-        if hasattr(self, 'bark_frame') and self.bark_frame: self.bark_frame.pack_forget()
-        if hasattr(self, 'elevenlabs_frame') and self.elevenlabs_frame: self.elevenlabs_frame.pack_forget()
-
-        # Show the frame corresponding to the selected model
-        if selected_model == "XTTSv2" and hasattr(self, 'xtts_frame') and self.xtts_frame: self.xtts_frame.pack(fill=tk.X)
-        elif selected_model == "Piper" and hasattr(self, 'piper_frame') and self.piper_frame: self.piper_frame.pack(fill=tk.X)
-        elif selected_model == "Bark" and hasattr(self, 'bark_frame') and self.bark_frame: self.bark_frame.pack(fill=tk.X)
-        elif selected_model == "ElevenLabs" and hasattr(self, 'elevenlabs_frame') and self.elevenlabs_frame: self.elevenlabs_frame.pack(fill=tk.X)
-
-        self.update_idletasks()
+        Frames are built on first selection and then stacked in the same
+        grid cell, so switching engines is a single O(1) tkraise (plus a
+        one-time construction the first time an engine is chosen).
+        """
+        selected_model = self.model_choice.get()
+        logger.info("Switching parameter view to: %s", selected_model)
+
+        frame = getattr(self, '_param_frames', {}).get(selected_model)
+        if frame is None:
+            frame = self._build_param_frame(selected_model)
+        if frame: frame.tkraise()
+
+    def _build_param_frame(self, model_name: str):
+        """Builds, registers and stacks the parameter frame for an engine."""
+        recipe = getattr(self, '_param_frame_recipes', {}).get(model_name)
+        if recipe is None: return None
+        attr_name, factory = recipe
+        frame = factory()
+        setattr(self, attr_name, frame)
+        self._param_frames[model_name] = frame
+        frame.grid(row=0, column=0, in_=self.param_frame_container, sticky="nsew")
+        return frame
 
     def browse_file(self, string_var: tk.StringVar, title: str, filetypes: list, initialdir: str):
         """Opens a file dialog and sets the selected path to a StringVar. (Called by UI modules)"""
-        if not os.path.isdir(initialdir): initialdir = os.path.expanduser("~")
+        if not _isdir_cached(initialdir): initialdir = os.path.expanduser("~")
         filename = filedialog.askopenfilename(title=title, filetypes=filetypes, initialdir=initialdir)
         if filename: string_var.set(filename)
 
@@ -180,26 +419,51 @@ class TTSApp(tk.Tk):
         current_path = self.output_file_path.get()
         initial_filename = os.path.basename(current_path) if current_path else "output.wav"
         initial_dir = os.path.dirname(current_path) or DEFAULT_OUTPUT_DIR
-        if not os.path.isdir(initial_dir): initial_dir = DEFAULT_OUTPUT_DIR
+        if not _isdir_cached(initial_dir): initial_dir = DEFAULT_OUTPUT_DIR
         filepath = filedialog.asksaveasfilename(title="Save Audio As", defaultextension=".wav", filetypes=[("WAV files", "*.wav"), ("All files", "*.*")], initialdir=initial_dir, initialfile=initial_filename)
         if filepath:
             if not filepath.lower().endswith(".wav"): filepath += ".wav"
             self.output_file_path.set(filepath)
 
+    def _on_output_path_write(self, *_args):
+        """Write-trace on the output path; debounced so rapid typing fires
+        one validation 150 ms after the last keystroke instead of one per
+        character."""
+        if self._out_path_debounce is not None:
+            self.after_cancel(self._out_path_debounce)
+        self._out_path_debounce = self.after(150, self._validate_output_path)
+
+    def _validate_output_path(self):
+        """Marks the output entry red while its directory does not exist."""
+        self._out_path_debounce = None
+        if self.output_entry is None: return
+        directory = os.path.dirname(self.output_file_path.get().strip())
+        ok = not directory or _isdir_cached(directory)
+        if ok != self._out_path_ok:
+            self._out_path_ok = ok
+            try: self.output_entry.config(foreground="" if ok else "red")
+            except tk.TclError: pass
+
     def update_status(self, message: str, clear_after: Optional[int] = None):
         """Updates the status bar text (thread-safe via self.after). (Called by UI modules and app logic)"""
+        # Capture the widget once; the scheduled closures then work on a
+        # local instead of re-resolving the attribute on the main thread for
+        # every status update.
+        label = self.status_label
+        if label is None: return
+        cfg = label.config  # Bind once; the closures reuse the bound method
         def _update_in_main_thread():
-            if hasattr(self, 'status_label'):
-                self.status_label.config(text=message)
-                if clear_after is not None: self.after(clear_after * 1000, lambda: self.status_label.config(text="Ready.") if hasattr(self, 'status_label') else None)
+            cfg(text=message)
+            if clear_after is not None: self.after(clear_after * 1000, lambda: cfg(text="Ready."))
         self.after(0, _update_in_main_thread)
 
     def set_ui_state(self, state: str):
         """Enables/disables main UI elements during processing."""
-        gui_state = tk.NORMAL if state == 'normal' else tk.DISABLED
-        if hasattr(self, 'synthesize_button'): self.synthesize_button.config(state=gui_state)
-        if hasattr(self, 'model_menu'): self.model_menu.config(state=gui_state)
-        if hasattr(self, 'browse_output_button'): self.browse_output_button.config(state=gui_state)
+        gui_state = _TK_NORMAL if state == 'normal' else _TK_DISABLED
+        # One loop over the registry (filled once after UI construction)
+        # instead of a per-widget existence check on every call.
+        for widget in self._main_controls:
+            widget.config(state=gui_state)
         # Playback controls have their own logic
 
     # --- ElevenLabs Specific UI Methods (REMOVED - Now in ui_engines/elevenlabs_ui.py) ---
@@ -212,156 +476,402 @@ class TTSApp(tk.Tk):
 
     # --- Audio List & Playback Methods (UNCHANGED) ---
     def load_existing_audio(self):
-        if not hasattr(self, 'audio_listbox'): return
-        self.audio_listbox.delete(0, tk.END); self.audio_files.clear()
+        """Scans the output directory in a worker thread and fills the listbox.
+
+        The enumeration + per-file stats are pure I/O, so they run off the Tk
+        thread and the finished list is marshaled back via after() — the UI
+        paints immediately at startup while the history materializes.
+        """
+        if self.audio_listbox is None: return
+        threading.Thread(target=self._load_existing_audio_worker, daemon=True).start()
+
+    def _load_existing_audio_worker(self):
         try:
-            audio_exts = ('*.wav', '*.mp3'); all_audio_files = []
-            for ext in audio_exts: all_audio_files.extend(glob.glob(os.path.join(DEFAULT_OUTPUT_DIR, ext)))
-            all_audio_files.sort(key=os.path.getmtime, reverse=True)
-            for f_path in all_audio_files: f_name = os.path.basename(f_path); self.audio_files[f_name] = f_path; self.audio_listbox.insert(tk.END, f_name)
-            logging.info(f"{len(self.audio_files)} existing audio files loaded.")
-        except Exception as e: logging.error(f"Error loading existing audio: {e}")
+            # One scandir pass: DirEntry caches the stat from directory
+            # enumeration, so sorting by mtime needs no extra syscall per file
+            # (glob + getmtime stats each file twice).
+            with os.scandir(DEFAULT_OUTPUT_DIR) as it:
+                entries = [e for e in it if e.is_file() and e.name.lower().endswith(('.wav', '.mp3'))]
+            # (-mtime_ns, name): newest first, deterministic for files that
+            # share an mtime (coarse-granularity filesystems), and integer
+            # comparisons instead of float ones.
+            entries.sort(key=lambda e: (-e.stat(follow_symlinks=False).st_mtime_ns, e.name))
+            names = [e.name for e in entries]
+            mapping = {e.name: e.path for e in entries}
+        except Exception as e:
+            logging.error("Error loading existing audio: %s", e); return
+        self.after(0, self._install_audio_list, names, mapping)
+
+    def _install_audio_list(self, names: List[str], mapping: Dict[str, str]):
+        if self.audio_listbox is None: return
+        self.audio_listbox.delete(0, tk.END)
+        self.audio_files.clear(); self.audio_files.update(mapping)
+        # One insert with all names: a single Tcl round-trip instead of
+        # one bridge crossing per file.
+        if names: self.audio_listbox.insert(tk.END, *names)
+        logging.info("%d existing audio files loaded.", len(self.audio_files))
+
+    def _sweep_synth_cache(self):
+        """Periodic synthesis-cache eviction; reschedules itself."""
+        self.after(_SYNTH_CACHE_SWEEP_MS, self._sweep_synth_cache)
+        threading.Thread(target=self._sweep_synth_cache_worker, daemon=True).start()
+
+    @staticmethod
+    def _sweep_synth_cache_worker():
+        """Deletes the oldest cached WAVs once the cache exceeds its bound."""
+        try:
+            with os.scandir(_SYNTH_CACHE_DIR) as it:
+                entries = [(e.stat(follow_symlinks=False).st_mtime_ns, e.path)
+                           for e in it if e.is_file(follow_symlinks=False)]
+        except OSError:
+            return  # Cache directory missing or unreadable; nothing to sweep.
+        excess = len(entries) - _SYNTH_CACHE_MAX_FILES
+        if excess <= 0: return
+        entries.sort()
+        for _, path in entries[:excess]:
+            try: os.remove(path)
+            except OSError: pass
+        logging.info("Synthesis cache sweep removed %d old entries.", excess)
 
     def add_audio_to_list(self, file_path: str):
-        if not hasattr(self, 'audio_listbox'): return
+        if self.audio_listbox is None: return
         if os.path.exists(file_path):
             f_name = os.path.basename(file_path)
             if f_name not in self.audio_files:
-                self.audio_files[f_name] = file_path; self.audio_listbox.insert(0, f_name)
-                logging.info(f"Audio file added to list: {f_name}")
-                self.audio_listbox.selection_clear(0, tk.END); self.audio_listbox.selection_set(0); self.on_audio_select()
+                self.audio_files[f_name] = file_path
+                self.audio_listbox.insert(0, f_name)
+                logger.info("Audio file added to list: %s", f_name)
+            elif self.audio_files[f_name] != file_path:
+                # Known name, new location: adopt the path and move the entry
+                # to the top so the fresh output gets selected below.
+                self.audio_files[f_name] = file_path
+                try: self.audio_listbox.delete(list(self.audio_listbox.get(0, tk.END)).index(f_name))
+                except ValueError: pass
+                self.audio_listbox.insert(0, f_name)
+            else:
+                return  # Already listed with the same path; nothing to do.
+            # Only clear when a selection actually exists (tracked by
+            # on_audio_select), saving one Tcl round-trip per generation.
+            if self._audio_has_selection: self.audio_listbox.selection_clear(0, tk.END)
+            self.audio_listbox.selection_set(0); self.on_audio_select()
 
     def on_audio_select(self, event=None):
-        if not self.mixer_initialized or not hasattr(self, 'audio_listbox'): return
+        if not self.mixer_initialized or self.audio_listbox is None: return
         selected_indices = self.audio_listbox.curselection()
+        self._audio_has_selection = bool(selected_indices)
         if not selected_indices: self.selected_audio_path = None; self.disable_playback_controls(); return
         selected_filename = self.audio_listbox.get(selected_indices[0])
         if selected_filename in self.audio_files:
             new_path = self.audio_files[selected_filename]
             if new_path != self.selected_audio_path:
-                self.selected_audio_path = new_path; logging.info(f"Selected audio: {self.selected_audio_path}"); self.stop_audio()
+                self.selected_audio_path = new_path; logger.info("Selected audio: %s", new_path); self.stop_audio()
+                # Even header-only reads are file I/O; run them off the Tk
+                # thread so slow storage cannot stall the selection handler,
+                # then marshal the result back via after() (same pattern as
+                # the voices fetch).
+                # Re-selecting a file should not redo the probe: key on
+                # (path, mtime, size) so an overwritten output invalidates
+                # its cached duration automatically.
+                try:
+                    st = os.stat(new_path)
+                    cache_key = (new_path, st.st_mtime_ns, st.st_size)
+                except OSError:
+                    cache_key = None
+                if cache_key is not None and cache_key in self._duration_cache:
+                    self._duration_cache.move_to_end(cache_key)
+                    self._apply_duration(new_path, self._duration_cache[cache_key], None)
+                    return
+                self.update_status("Loading audio info...")
+                threading.Thread(target=self._compute_duration_worker, args=(new_path, cache_key), daemon=True).start()
+        else: logging.warning("Selected filename '%s' not found in dictionary.", selected_filename); self.selected_audio_path = None; self.disable_playback_controls()
+
+    def _compute_duration_worker(self, path: str, cache_key: Optional[Tuple[str, int, int]] = None):
+        """Computes the duration of an audio file in a worker thread."""
+        duration, error = None, None
+        try:
+            if path.lower().endswith(".mp3"):
+                # mutagen parses only the MP3 header/frames index; pydub
+                # would decode the whole stream through ffmpeg just to
+                # measure its length.
                 try:
-                    if self.selected_audio_path.lower().endswith(".mp3"):
-                         from pydub import AudioSegment; sound = AudioSegment.from_mp3(self.selected_audio_path); self.audio_duration = len(sound) / 1000.0
-                    else:
-                        with sf.SoundFile(self.selected_audio_path) as f: self.audio_duration = f.frames / f.samplerate
-                    logging.info(f"Duration: {self.audio_duration:.2f}s")
-                    if hasattr(self, 'seek_slider'): self.seek_slider.config(to=self.audio_duration, state=tk.NORMAL)
-                    self.update_time_label(); self.enable_playback_controls()
-                except ImportError: logging.error("pydub not found, cannot determine MP3 duration."); messagebox.showerror("Playback Error", "pydub library not found.\nCannot load MP3 files correctly.", parent=self); self.selected_audio_path = None; self.disable_playback_controls()
-                except Exception as e: logging.error(f"Error loading audio/getting duration: {e}", exc_info=True); messagebox.showerror("Playback Error", f"Error loading audio file:\n{e}", parent=self); self.selected_audio_path = None; self.disable_playback_controls()
-        else: logging.warning(f"Selected filename '{selected_filename}' not found in dictionary."); self.selected_audio_path = None; self.disable_playback_controls()
+                    from mutagen.mp3 import MP3
+                    duration = MP3(path).info.length
+                except ImportError:
+                    logging.warning("mutagen not found; falling back to full pydub decode for MP3 duration.")
+                    from pydub import AudioSegment
+                    duration = len(AudioSegment.from_mp3(path)) / 1000.0
+            else:
+                # sf.info reads only the header: O(1) duration probe
+                # regardless of file size, no sample data touched.
+                info = sf.info(path); duration = info.frames / info.samplerate
+        except Exception as e:
+            error = e
+            logging.error("Error loading audio/getting duration: %s", e, exc_info=True)
+        if duration is not None and cache_key is not None:
+            self._duration_cache[cache_key] = duration
+            while len(self._duration_cache) > _DURATION_CACHE_MAX:
+                self._duration_cache.popitem(last=False)
+        self.after(0, self._apply_duration, path, duration, error)
+
+    def _apply_duration(self, path: str, duration: Optional[float], error: Optional[Exception]):
+        """Applies a computed duration in the main GUI thread (stale-guarded)."""
+        if path != self.selected_audio_path: return  # Selection changed while probing
+        if error is not None or duration is None:
+            messagebox.showerror("Playback Error", f"Error loading audio file:\n{error}", parent=self)
+            self.selected_audio_path = None; self.disable_playback_controls(); return
+        self.audio_duration = duration
+        logger.info("Duration: %.2fs", self.audio_duration)
+        if self.seek_slider is not None: self.seek_slider.config(to=self.audio_duration, state=tk.NORMAL)
+        self._recompute_slider_step()
+        self.update_time_label(); self.enable_playback_controls()
+        self.update_status("Ready.")
 
     def disable_playback_controls(self):
-        if hasattr(self, 'play_button'): self.play_button.config(state=tk.DISABLED)
-        if hasattr(self, 'pause_button'): self.pause_button.config(state=tk.DISABLED)
-        if hasattr(self, 'stop_button'): self.stop_button.config(state=tk.DISABLED)
-        if hasattr(self, 'seek_slider'): self.seek_slider.config(state=tk.DISABLED, value=0)
+        for widget in self._playback_widgets:
+            widget.config(state=tk.DISABLED)
+        if self.seek_slider is not None: self.seek_slider.set(0)
         self.audio_duration = 0.0; self.update_time_label()
 
     def enable_playback_controls(self):
-        if not self.mixer_initialized: return
-        if hasattr(self, 'play_button') and hasattr(self, 'pause_button') and hasattr(self, 'stop_button') and hasattr(self, 'seek_slider'):
-            if self.selected_audio_path: self.play_button.config(state=tk.NORMAL); self.pause_button.config(state=tk.DISABLED); self.stop_button.config(state=tk.DISABLED); self.seek_slider.config(state=tk.NORMAL)
-            else: self.disable_playback_controls()
-
-    def format_time(self, seconds: float) -> str:
-        minutes, seconds = divmod(int(max(0, seconds)), 60); return f"{minutes:02d}:{seconds:02d}"
+        if not self.mixer_initialized or not self._playback_widgets: return
+        if self.selected_audio_path:
+            play, pause, stop, slider = self._playback_widgets
+            play.config(state=tk.NORMAL); pause.config(state=tk.DISABLED); stop.config(state=tk.DISABLED); slider.config(state=tk.NORMAL)
+        else: self.disable_playback_controls()
+
+    @staticmethod
+    def format_time(seconds: float) -> str:
+        minutes, seconds = divmod(int(seconds) if seconds > 0 else 0, 60); return f"{minutes:02d}:{seconds:02d}"
     def update_time_label(self, current_time: float = 0.0):
-        if hasattr(self, 'time_label'): self.time_label.config(text=f"{self.format_time(current_time)} / {self.format_time(self.audio_duration)}")
+        if self.time_label is not None:
+            # The total-duration half only changes when a new file loads;
+            # reuse its formatted form instead of redoing it at 4 Hz.
+            if self.audio_duration != self._total_time_src:
+                self._total_time_src = self.audio_duration
+                self._total_time_str = self.format_time(self.audio_duration)
+            self.time_label.config(text=f"{self.format_time(current_time)} / {self._total_time_str}")
 
     def play_audio(self):
         if not self.mixer_initialized or not self.selected_audio_path: return
         try:
             if not pygame.mixer.music.get_busy() and not self.is_paused:
+                # Drop the previous track's decoder buffer before loading the
+                # next one; otherwise it stays resident until the next
+                # explicit stop. unload() is a no-op when nothing is loaded.
+                try: pygame.mixer.music.unload()
+                except Exception: pass
                 pygame.mixer.music.load(self.selected_audio_path); pygame.mixer.music.play(); self.is_paused = False; self.start_playback_update()
             elif self.is_paused:
                 pygame.mixer.music.unpause(); self.is_paused = False; self.start_playback_update()
-            if hasattr(self, 'play_button'): self.play_button.config(state=tk.DISABLED)
-            if hasattr(self, 'pause_button'): self.pause_button.config(state=tk.NORMAL)
-            if hasattr(self, 'stop_button'): self.stop_button.config(state=tk.NORMAL)
-        except Exception as e: logging.error(f"Error playing audio: {e}", exc_info=True); messagebox.showerror("Playback Error", f"Could not play audio:\n{e}"); self.stop_audio()
+            if self.play_button is not None: self.play_button.config(state=tk.DISABLED)
+            if self.pause_button is not None: self.pause_button.config(state=tk.NORMAL)
+            if self.stop_button is not None: self.stop_button.config(state=tk.NORMAL)
+        except Exception as e: logging.error("Error playing audio: %s", e, exc_info=True); messagebox.showerror("Playback Error", f"Could not play audio:\n{e}"); self.stop_audio()
 
     def pause_audio(self):
         if not self.mixer_initialized or not pygame.mixer.music.get_busy(): return
         pygame.mixer.music.pause(); self.is_paused = True; self.stop_playback_update()
-        if hasattr(self, 'play_button'): self.play_button.config(state=tk.NORMAL)
-        if hasattr(self, 'pause_button'): self.pause_button.config(state=tk.DISABLED)
-        if hasattr(self, 'stop_button'): self.stop_button.config(state=tk.NORMAL)
+        if self.play_button is not None: self.play_button.config(state=tk.NORMAL)
+        if self.pause_button is not None: self.pause_button.config(state=tk.DISABLED)
+        if self.stop_button is not None: self.stop_button.config(state=tk.NORMAL)
 
     def stop_audio(self):
         if not self.mixer_initialized: return
         if pygame.mixer.music.get_busy() or self.is_paused:
             pygame.mixer.music.stop(); pygame.mixer.music.unload(); self.is_paused = False; self.stop_playback_update()
-            if hasattr(self, 'seek_slider'): self.seek_slider.set(0)
+            if self.seek_slider is not None: self.seek_slider.set(0)
             self.update_time_label()
             if self.selected_audio_path: self.enable_playback_controls()
             else: self.disable_playback_controls()
 
     def start_playback_update(self):
-        if hasattr(self, 'playback_update_id') and self.playback_update_id:
+        # playback_update_id is initialized in __init__, so a plain
+        # truthiness test suffices — no hasattr needed anywhere in the loop.
+        if self.playback_update_id:
             try: self.after_cancel(self.playback_update_id)
             except ValueError: pass
+        # Reset the dedupe state so the first tick always paints
+        self._last_slider_pos = -1.0; self._last_sec_int = -1
         self.update_playback_slider()
 
     def stop_playback_update(self):
-        if hasattr(self, 'playback_update_id') and self.playback_update_id:
+        if self.playback_update_id:
             try: self.after_cancel(self.playback_update_id)
             except ValueError: pass
             self.playback_update_id = None
 
     def update_playback_slider(self):
         if not self.mixer_initialized: return
-        if not hasattr(self, 'playback_update_id'): self.playback_update_id = None
-        self.playback_update_id = self.after(250, self.update_playback_slider)
-        if pygame.mixer.music.get_busy() and not self.is_paused and not self.is_seeking:
-            if hasattr(self, 'seek_slider'):
+        # 500 ms is plenty: the label only repaints on whole-second changes
+        # and the slider on whole-thumb-pixel moves, so a faster tick just
+        # burns Tcl round-trips on an idle GUI.
+        self.playback_update_id = self.after(500, self.update_playback_slider)
+        # A pending end-event means the track finished naturally; handle it
+        # directly and skip the rest of the tick.
+        try:
+            if pygame.event.get(self.music_end_event) and not self.is_paused:
+                logging.info("Playback finished naturally.")
+                self.after(100, self.stop_audio)
+                self.stop_playback_update()
+                return
+        except pygame.error: pass  # Event subsystem unavailable; busy-flag fallback below
+        # One SDL query per tick; the busy flag is reused below and passed to
+        # stop_audio_if_finished so the same tick never re-crosses the FFI.
+        busy = pygame.mixer.music.get_busy()
+        if busy and not self.is_paused and not self.is_seeking:
+            if self.seek_slider is not None:
                 try:
                     current_pos_ms = pygame.mixer.music.get_pos()
                     if current_pos_ms != -1:
                         current_pos_sec = max(0, min(current_pos_ms / 1000.0, self.audio_duration))
-                        self.seek_slider.set(current_pos_sec); self.update_time_label(current_pos_sec)
-                except pygame.error as e: logging.warning(f"Pygame error getting pos: {e}"); self.stop_audio_if_finished()
-                except Exception as e: logging.error(f"Error updating slider: {e}"); self.stop_playback_update()
-        elif not pygame.mixer.music.get_busy() and not self.is_paused:
-            self.stop_audio_if_finished()
-
-    def stop_audio_if_finished(self):
-        if hasattr(self, 'play_button') and self.play_button['state'] == tk.DISABLED and not self.is_paused:
-            if not pygame.mixer.music.get_busy():
+                        # Skip redundant Tcl round-trips: the slider only
+                        # moves when the position advanced at least one
+                        # thumb pixel and the mm:ss label only when the
+                        # second changed.
+                        if abs(current_pos_sec - self._last_slider_pos) >= self._slider_step:
+                            self._last_slider_pos = current_pos_sec
+                            self.seek_slider.set(current_pos_sec)
+                        cur_sec_int = int(current_pos_sec)
+                        if cur_sec_int != self._last_sec_int:
+                            self._last_sec_int = cur_sec_int
+                            self.update_time_label(current_pos_sec)
+                except pygame.error as e: logger.warning("Pygame error getting pos: %s", e); self.stop_audio_if_finished()
+                except Exception as e: logger.error("Error updating slider: %s", e); self.stop_playback_update()
+        elif not busy and not self.is_paused:
+            self.stop_audio_if_finished(busy=busy)
+
+    def _recompute_slider_step(self, event=None):
+        """Smallest position change (seconds) that moves the slider thumb a pixel.
+
+        Recomputed only when the duration or the slider width changes, so the
+        playback tick can skip sub-pixel updates with one float compare.
+        """
+        if self.seek_slider is None or self.audio_duration <= 0:
+            self._slider_step = 0.25; return
+        width = max(1, self.seek_slider.winfo_width())
+        self._slider_step = max(0.25, self.audio_duration / width)
+
+    def stop_audio_if_finished(self, busy: Optional[bool] = None):
+        if self.play_button is not None and self.play_button['state'] == tk.DISABLED and not self.is_paused:
+            if busy is None: busy = pygame.mixer.music.get_busy()
+            if not busy:
                 logging.info("Playback finished naturally.")
                 self.after(100, self.stop_audio)
                 self.stop_playback_update()
 
     def on_seek_press(self, event):
-        if hasattr(self, 'seek_slider') and self.seek_slider['state'] == tk.NORMAL: self.is_seeking = True
+        if self.seek_slider is not None and self.seek_slider['state'] == tk.NORMAL: self.is_seeking = True
     def on_seek_release(self, event):
-        if hasattr(self, 'seek_slider') and self.seek_slider['state'] == tk.NORMAL and self.is_seeking:
+        if self.seek_slider is not None and self.seek_slider['state'] == tk.NORMAL and self.is_seeking:
             self.is_seeking = False; self.seek_audio(self.seek_slider.get())
     def on_seek_slider_move(self, value):
-        self.update_time_label(float(value))
+        # Tk fires this for every pixel of a drag; coalesce to at most one
+        # label repaint per 50 ms. The flush reads the slider itself so the
+        # most recent position always wins.
+        if self._seek_move_after_id is not None: return
+        self._seek_move_after_id = self.after(50, self._flush_seek_label)
+
+    def _flush_seek_label(self):
+        self._seek_move_after_id = None
+        if self.seek_slider is not None:
+            self.update_time_label(float(self.seek_slider.get()))
 
     def seek_audio(self, seconds: float):
         if not self.mixer_initialized or not self.selected_audio_path: return
         try:
             seek_time_sec = max(0, min(seconds, self.audio_duration))
             pygame.mixer.music.play(start=seek_time_sec);
-            logging.info(f"Seeked to {seek_time_sec:.2f}s")
+            logger.info("Seeked to %.2fs", seek_time_sec)
             if self.is_paused: pygame.mixer.music.pause()
             else:
                 self.start_playback_update()
-                if hasattr(self, 'play_button'): self.play_button.config(state=tk.DISABLED)
-                if hasattr(self, 'pause_button'): self.pause_button.config(state=tk.NORMAL)
-                if hasattr(self, 'stop_button'): self.stop_button.config(state=tk.NORMAL)
-            if hasattr(self, 'seek_slider'): self.seek_slider.set(seek_time_sec)
+                if self.play_button is not None: self.play_button.config(state=tk.DISABLED)
+                if self.pause_button is not None: self.pause_button.config(state=tk.NORMAL)
+                if self.stop_button is not None: self.stop_button.config(state=tk.NORMAL)
+            if self.seek_slider is not None: self.seek_slider.set(seek_time_sec)
             self.update_time_label(seek_time_sec)
-        except pygame.error as e: logging.error(f"Pygame seek error: {e}", exc_info=True); messagebox.showerror("Playback Error", f"Seek error:\n{e}")
-        except Exception as e: logging.error(f"Seek error: {e}", exc_info=True); messagebox.showerror("Playback Error", f"Unexpected seek error:\n{e}")
+        except pygame.error as e: logging.error("Pygame seek error: %s", e, exc_info=True); messagebox.showerror("Playback Error", f"Seek error:\n{e}")
+        except Exception as e: logging.error("Seek error: %s", e, exc_info=True); messagebox.showerror("Playback Error", f"Unexpected seek error:\n{e}")
+
+    # --- Synthesis Logic ---
+    # Per-engine parameter builders. Each fills `params` in place, raising
+    # ValueError/FileNotFoundError for anything the user must fix, and is
+    # dispatched through _MODEL_DISPATCH below.
+    def _build_xtts_params(self, params: dict):
+        params['speaker_wav_path'] = self.xtts_speaker_wav.get().strip() or 'tts_engines/dummy_speaker.wav'
+
+        # Extract language code from display format
+        language_display = self.xtts_language.get().strip()
+        if "(" in language_display and ")" in language_display:
+            start = language_display.rfind("(") + 1
+            end = language_display.rfind(")")
+            language_code = language_display[start:end]
+        else:
+            language_code = "nl"  # fallback
+        params['language'] = language_code
+
+        # Extract model key from display format
+        model_display = self.xtts_model.get().strip()
+        model_key = "xtts_v2"  # default fallback
+
+        # Try to get the actual model key using the frame mapping
+        if hasattr(self.xtts_frame, '_model_mapping'):
+            model_key = self.xtts_frame._model_mapping.get(model_display, "xtts_v2")
+        else:
+            # Fallback: try to match by name
+            try:
+                available_models = _engine("xtts").get_available_models()
+                for key, info in available_models.items():
+                    if info['name'] in model_display:
+                        model_key = key
+                        break
+            except:
+                pass  # Use fallback
+
+        params['model_key'] = model_key
+
+        if not params['language']:
+            raise ValueError("TTS language is required.")
+
+        logging.info("TTS synthesis: model=%s, language=%s", model_key, language_code)
+
+    def _build_piper_params(self, params: dict):
+        params['model_onnx_path'] = self.piper_onnx_path.get().strip()
+        params['model_json_path'] = self.piper_json_path.get().strip()
+        if not params['model_onnx_path'] or not params['model_json_path']: raise ValueError("Piper requires both .onnx and .json model files.")
+        if not os.path.exists(params['model_onnx_path']): raise FileNotFoundError(f"Piper ONNX file not found: {params['model_onnx_path']}")
+        if not os.path.exists(params['model_json_path']): raise FileNotFoundError(f"Piper JSON file not found: {params['model_json_path']}")
+
+    def _build_bark_params(self, params: dict):
+        params['voice_preset'] = self.bark_voice_preset.get().strip()
+        if not params['voice_preset']: raise ValueError("Bark voice preset is required.")
+
+    def _build_elevenlabs_params(self, params: dict):
+        selected_voice_name = self.elevenlabs_voice_name.get() # Get name from StringVar
+        if not selected_voice_name: raise ValueError("Please select an ElevenLabs voice.")
+        # Look up ID in the app's voice map (populated by elevenlabs_ui)
+        if selected_voice_name not in self.elevenlabs_voices: raise ValueError(f"Selected voice '{selected_voice_name}' not found or voices not loaded.")
+        params['voice_id'] = self.elevenlabs_voices[selected_voice_name] # Use the map
+        params['model_id'] = self.elevenlabs_model_id.get()
+        if not params['model_id']: raise ValueError("Please select an ElevenLabs model.")
+        # Pass the currently active validated key stored in the app instance
+        if not self.current_elevenlabs_key: raise ValueError("ElevenLabs API key is not set or validated. Please select/enter a valid key via the UI.")
+        params['api_key'] = self.current_elevenlabs_key
+
+    # Maps the model dropdown value to (param builder, engine module key,
+    # synthesis function name). The engine function is resolved through
+    # _engine() at dispatch time so the table never forces an import.
+    _MODEL_DISPATCH = {
+        "XTTSv2": (_build_xtts_params, "xtts", "synthesize_xtts"),
+        "Piper": (_build_piper_params, "piper", "synthesize_piper"),
+        "Bark": (_build_bark_params, "bark", "synthesize_bark"),
+        "ElevenLabs": (_build_elevenlabs_params, "elevenlabs", "synthesize_elevenlabs"),
+    }
 
-    # --- Synthesis Logic (UNCHANGED, except for EL parameter gathering) ---
     def start_synthesis_thread(self):
-        if not hasattr(self, 'text_input'): messagebox.showerror("Error", "Text input field not initialized."); return
+        if self.text_input is None: messagebox.showerror("Error", "Text input field not initialized."); return
         text = self.text_input.get("1.0", tk.END).strip()
+        if self.text_input.tag_ranges("ghost"): text = ""  # Placeholder only.
         output_path = self.output_file_path.get().strip()
         model_type = self.model_choice.get()
 
@@ -370,101 +880,126 @@ class TTSApp(tk.Tk):
         if not output_path.lower().endswith(".wav"): output_path += ".wav"; self.output_file_path.set(output_path)
         output_dir = os.path.dirname(output_path)
         if output_dir and not os.path.exists(output_dir):
-            try: os.makedirs(output_dir); logging.info(f"Output directory created: {output_dir}");
+            try: os.makedirs(output_dir); logging.info("Output directory created: %s", output_dir);
             except OSError as e: messagebox.showerror("Error", f"Could not create output directory:\n{e}"); return
         if not model_type: messagebox.showerror("Input Error", "Please select a TTS model."); return
 
         params = {'text': text, 'output_path': output_path}
-        target_function = None
         try:
-            if model_type == "XTTSv2":
-                params['speaker_wav_path'] = self.xtts_speaker_wav.get().strip() or 'tts_engines/dummy_speaker.wav'
-
-                # Extract language code from display format
-                language_display = self.xtts_language.get().strip()
-                if "(" in language_display and ")" in language_display:
-                    start = language_display.rfind("(") + 1
-                    end = language_display.rfind(")")
-                    language_code = language_display[start:end]
-                else:
-                    language_code = "nl"  # fallback
-                params['language'] = language_code
-
-                # Extract model key from display format
-                model_display = self.xtts_model.get().strip()
-                model_key = "xtts_v2"  # default fallback
-
-                from tts_engines import xtts_engine
-
-                # Try to get the actual model key using the frame mapping
-                if hasattr(self.xtts_frame, '_model_mapping'):
-                    model_key = self.xtts_frame._model_mapping.get(model_display, "xtts_v2")
-                else:
-                    # Fallback: try to match by name
-                    try:
-                        available_models = xtts_engine.get_available_models()
-                        for key, info in available_models.items():
-                            if info['name'] in model_display:
-                                model_key = key
-                                break
-                    except:
-                        pass  # Use fallback
-
-                params['model_key'] = model_key  # NEW: Pass model key
-
-                if not params['language']:
-                    raise ValueError("TTS language is required.")
-
-
-                logging.info(f"TTS synthesis: model={model_key}, language={language_code}")
-                target_function = xtts_engine.synthesize_xtts
-
-            elif model_type == "Piper":
-                params['model_onnx_path'] = self.piper_onnx_path.get().strip()
-                params['model_json_path'] = self.piper_json_path.get().strip()
-                if not params['model_onnx_path'] or not params['model_json_path']: raise ValueError("Piper requires both .onnx and .json model files.")
-                if not os.path.exists(params['model_onnx_path']): raise FileNotFoundError(f"Piper ONNX file not found: {params['model_onnx_path']}")
-                if not os.path.exists(params['model_json_path']): raise FileNotFoundError(f"Piper JSON file not found: {params['model_json_path']}")
-                target_function = piper_engine.synthesize_piper
-            elif model_type == "Bark":
-                params['voice_preset'] = self.bark_voice_preset.get().strip()
-                if not params['voice_preset']: raise ValueError("Bark voice preset is required.")
-                target_function = bark_engine.synthesize_bark
-            elif model_type == "ElevenLabs":
-                selected_voice_name = self.elevenlabs_voice_name.get() # Get name from StringVar
-                if not selected_voice_name: raise ValueError("Please select an ElevenLabs voice.")
-                 # Look up ID in the app's voice map (populated by elevenlabs_ui)
-                if selected_voice_name not in self.elevenlabs_voices: raise ValueError(f"Selected voice '{selected_voice_name}' not found or voices not loaded.")
-                params['voice_id'] = self.elevenlabs_voices[selected_voice_name] # Use the map
-                params['model_id'] = self.elevenlabs_model_id.get()
-                if not params['model_id']: raise ValueError("Please select an ElevenLabs model.")
-                # Pass the currently active validated key stored in the app instance
-                if not self.current_elevenlabs_key: raise ValueError("ElevenLabs API key is not set or validated. Please select/enter a valid key via the UI.")
-                params['api_key'] = self.current_elevenlabs_key
-                target_function = elevenlabs_engine.synthesize_elevenlabs
-            else:
+            dispatch = self._MODEL_DISPATCH.get(model_type)
+            if dispatch is None:
                 raise ValueError(f"Unknown model type selected: {model_type}")
-
+            builder, engine_name, function_name = dispatch
+            builder(self, params)
+            target_function = getattr(_engine(engine_name), function_name)
         except (ValueError, FileNotFoundError) as e: messagebox.showerror("Parameter Error", str(e)); return
         except Exception as e: messagebox.showerror("Unexpected Error", f"Error preparing synthesis: {e}"); logging.error("Error preparing synthesis", exc_info=True); return
 
         self.set_ui_state('disabled')
         self.update_status(f"Starting {model_type} synthesis...")
-        synthesis_thread = threading.Thread(target=self.run_synthesis, args=(target_function, params, output_path), daemon=True)
-        synthesis_thread.start()
-
-    def run_synthesis(self, synthesis_function, params: dict, generated_file_path: str):
+        # Identical requests reuse the cached WAV instead of re-synthesizing.
+        cache_path = None
+        try:
+            os.makedirs(_SYNTH_CACHE_DIR, exist_ok=True)
+            cache_path = os.path.join(_SYNTH_CACHE_DIR, f"{_synth_cache_key(model_type, params)}.wav")
+        except OSError as e:
+            logging.warning("Synthesis cache unavailable: %s", e)
+        # One persistent single-worker executor: synthesis jobs reuse the same
+        # thread (model caches stay warm on it) and cannot run concurrently,
+        # which the engines do not support anyway.
+        # Decided here, on the Tk thread: the worker must not read Tk vars.
+        use_longform = (
+            self.parallel_longform.get()
+            and model_type in self._LONGFORM_ENGINES
+            and len(text) > _LONGFORM_MIN_CHARS
+        )
+        self._synthesis_executor.submit(self.run_synthesis, target_function, params, output_path, cache_path, model_type, use_longform)
+
+    # Engines whose output the chunked long-form path can stitch (all emit
+    # plain WAV files; ElevenLabs may return MP3 and is excluded).
+    _LONGFORM_ENGINES = frozenset(("XTTSv2", "Piper", "Bark"))
+
+    def _run_longform(self, synthesis_function, params: dict, model_type: str):
+        """Synthesizes sentence chunks to temp WAVs, then stitches them.
+
+        Chunks run sequentially — the local backends share per-process model
+        state and are not safe to call concurrently — but each finished
+        sentence updates the status bar, and a failure reports which chunk
+        broke instead of losing the whole paragraph.
+        """
+        sentences = _split_sentences(params['text'])
+        if len(sentences) < 2:
+            return synthesis_function(**params)
+        output_path = params['output_path']
+        chunk_dir = tempfile.mkdtemp(prefix="longform-", dir=DEFAULT_OUTPUT_DIR)
+        try:
+            total = len(sentences)
+            chunk_paths = []
+            for index, sentence in enumerate(sentences, start=1):
+                self.update_status(f"Synthesizing... {index}/{total} sentences ({model_type})")
+                chunk_path = os.path.join(chunk_dir, f"chunk_{index:04d}.wav")
+                success, message = synthesis_function(**dict(params, text=sentence, output_path=chunk_path))
+                if not success:
+                    return False, f"Chunk {index}/{total} failed: {message}"
+                chunk_paths.append(chunk_path)
+            self._concat_wavs(chunk_paths, output_path)
+            return True, f"Audio successfully saved in {output_path}"
+        except Exception as e:
+            logging.error("Long-form synthesis error: %s", e, exc_info=True)
+            return False, f"Long-form synthesis failed: {e}"
+        finally:
+            shutil.rmtree(chunk_dir, ignore_errors=True)
+
+    @staticmethod
+    def _concat_wavs(chunk_paths: List[str], output_path: str):
+        """Splices WAV chunks into the output file at the PCM-frame level.
+
+        Raw frames are stream-copied in fixed-size blocks, so memory stays
+        O(block) regardless of total length — a 20-minute stitch never
+        decodes into arrays or buffers whole files.
+        """
+        with wave.open(chunk_paths[0], "rb") as first:
+            params = first.getparams()
+        with wave.open(output_path, "wb") as out:
+            out.setparams(params)
+            for path in chunk_paths:
+                with wave.open(path, "rb") as src:
+                    while True:
+                        frames = src.readframes(16384)
+                        if not frames: break
+                        out.writeframesraw(frames)
+
+    def run_synthesis(self, synthesis_function, params: dict, generated_file_path: str,
+                      cache_path: Optional[str] = None, model_type: str = "",
+                      use_longform: bool = False):
         """Runs the synthesis function in the worker thread and handles UI updates."""
         success, message = False, "Synthesis started..."
         start_time = time.time()
         try:
-            self.update_status(f"Synthesizing... ({self.model_choice.get()}) This may take a while.")
-            log_params = {k: v for k, v in params.items() if k != 'api_key'} # Avoid logging key
-            logging.info(f"Calling {synthesis_function.__name__} with params: {log_params}")
-            success, message = synthesis_function(**params) # Call the engine
+            if cache_path is not None and os.path.exists(cache_path):
+                shutil.copyfile(cache_path, generated_file_path)
+                os.utime(cache_path)  # Refresh mtime so the sweep keeps hot entries.
+                success = True
+                message = f"Reused cached audio for identical request: {generated_file_path}"
+                logging.info("Synthesis cache hit: %s", cache_path)
+            else:
+                # model_type was captured on the Tk thread: StringVar reads
+                # from the worker would cross into Tcl off the main thread.
+                self.update_status(f"Synthesizing... ({model_type}) This may take a while.")
+                log_params = {k: v for k, v in params.items() if k != 'api_key'} # Avoid logging key
+                logging.info("Calling %s with params: %s", synthesis_function.__name__, log_params)
+                if use_longform:
+                    success, message = self._run_longform(synthesis_function, params, model_type)
+                else:
+                    success, message = synthesis_function(**params) # Call the engine
+                # Store a copy for future identical requests. Skip when the
+                # engine redirected output elsewhere (e.g. saved as MP3).
+                if success and cache_path is not None and os.path.exists(generated_file_path):
+                    try: shutil.copyfile(generated_file_path, cache_path)
+                    except OSError as e: logging.warning("Could not cache synthesis result: %s", e)
         except Exception as e:
             success = False; message = f"Unexpected error during synthesis: {e}"
-            logging.error(f"Synthesis error in worker thread: {e}\n{traceback.format_exc()}")
+            logging.error("Synthesis error in worker thread: %s\n%s", e, traceback.format_exc())
         finally:
             self.after(0, lambda: self.set_ui_state('normal'))
             duration = time.time() - start_time
@@ -479,13 +1014,37 @@ class TTSApp(tk.Tk):
                 self.update_status("Synthesis failed.", clear_after=10)
                 self.after(0, lambda: messagebox.showerror("Error", final_message))
 
+    def _show_audio_warning_toast(self):
+        """Shows a self-dismissing warning that playback is unavailable."""
+        try:
+            toast = tk.Toplevel(self)
+            toast.overrideredirect(True)
+            toast.attributes("-topmost", True)
+            label = ttk.Label(
+                toast,
+                text="Could not initialize audio playback.\nPlayback functions are disabled.",
+                foreground="red", padding=10, justify=tk.LEFT,
+            )
+            label.pack()
+            # Bottom-right corner of the main window.
+            self.update_idletasks()
+            toast.update_idletasks()
+            x = self.winfo_x() + self.winfo_width() - toast.winfo_reqwidth() - 20
+            y = self.winfo_y() + self.winfo_height() - toast.winfo_reqheight() - 20
+            toast.geometry(f"+{x}+{y}")
+            toast.after(6000, toast.destroy)
+        except tk.TclError:
+            pass  # Window already closed.
+
     # --- Application Closing (UNCHANGED) ---
     def on_closing(self):
         logging.info("Closing application..."); self.stop_playback_update()
+        elevenlabs_ui.shutdown_io_pool()
+        self._synthesis_executor.shutdown(wait=False)
         if self.mixer_initialized:
             logging.info("Stopping pygame mixer...");
             try: pygame.mixer.music.stop(); pygame.mixer.quit(); pygame.quit(); logging.info("Pygame closed successfully.")
-            except Exception as e: logging.error(f"Error closing pygame: {e}")
+            except Exception as e: logging.error("Error closing pygame: %s", e)
         self.destroy()
 
     # --- Initialization Method (MODIFIED) ---
@@ -494,18 +1053,78 @@ class TTSApp(tk.Tk):
         super().__init__()
         self.title("Multi TTS Synthesizer")
         self.geometry("950x665")
+        # Keep the window unmapped while ~20 pack calls build the layout:
+        # Tk batches the geometry work and paints once at deiconify below,
+        # instead of propagating and repainting after every pack.
+        self.withdraw()
 
         # --- Initialize Pygame Mixer ---
-        try:
-            pygame.init(); pygame.mixer.init(); logging.info("Pygame mixer initialized.")
-            self.mixer_initialized = True
-        except Exception as e:
-            logging.error(f"Could not initialize pygame mixer: {e}", exc_info=True)
-            self.mixer_initialized = False
+        self.mixer_initialized = False
+        if not _audio_available():
+            logging.warning("No audio backend detected; skipping pygame mixer init.")
+        else:
+            try:
+                pygame.init(); pygame.mixer.init(); logging.info("Pygame mixer initialized.")
+                self.mixer_initialized = True
+                # Have SDL post an event when a track finishes so the playback
+                # tick can detect natural end-of-music by draining the queue
+                # instead of inferring it from busy-flag polling.
+                self.music_end_event = pygame.USEREVENT + 1
+                pygame.mixer.music.set_endevent(self.music_end_event)
+            except Exception as e:
+                logging.error("Could not initialize pygame mixer: %s", e, exc_info=True)
 
         # --- Ensure Output Directory Exists ---
         os.makedirs(DEFAULT_OUTPUT_DIR, exist_ok=True)
 
+        # --- Predeclare Widget Attributes ---
+        # Widgets referenced from handlers before/while the UI is being built.
+        # Declaring them as None up front lets those handlers use a plain
+        # 'is not None' check instead of hasattr's try/except machinery.
+        self.text_input = None
+        self.text_context_menu = None
+        self._ctxmenu_last_states: Dict[str, str] = {}  # Last entryconfig states
+        self._sel_nonempty = False  # Maintained by the <<Selection>> binding
+        # (path, mtime_ns, size) -> seconds; LRU-bounded at _DURATION_CACHE_MAX
+        self._duration_cache: "OrderedDict[Tuple[str, int, int], float]" = OrderedDict()
+        # Last values pushed to the playback slider / time label, used to
+        # suppress redundant Tk updates in update_playback_slider
+        self._last_slider_pos = -1.0
+        self._last_sec_int = -1
+        # Cached formatted total duration for update_time_label
+        self._total_time_src = -1.0
+        self._total_time_str = "00:00"
+        # Seconds per slider pixel; kept current by _recompute_slider_step
+        self._slider_step = 0.25
+        # Whether the audio listbox currently has a selection (tracked by
+        # on_audio_select so add_audio_to_list can skip redundant clears)
+        self._audio_has_selection = False
+        # Persistent worker for synthesis jobs; see start_synthesis_thread
+        self._synthesis_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts-synth")
+        self.status_label = None
+        self.synthesize_button = None
+        self.model_menu = None
+        self.browse_output_button = None
+        self.output_entry = None
+        self._out_path_debounce = None  # after() id for the pending validation
+        self._out_path_ok = True
+        self._seek_move_after_id = None  # after() id coalescing seek-drag labels
+        self.play_button = None
+        self.pause_button = None
+        self.stop_button = None
+        self.seek_slider = None
+        self.time_label = None
+        self.audio_listbox = None
+        # Widget registries, filled once after the corresponding widgets are
+        # built; the state-toggling methods just loop over them.
+        self._main_controls: Tuple = ()
+        self._playback_widgets: Tuple = ()
+        # Engine parameter frames, built lazily by _build_param_frame
+        self.xtts_frame = None
+        self.piper_frame = None
+        self.bark_frame = None
+        self.elevenlabs_frame = None
+
         # --- Initialize Application State Variables (Tkinter Vars) ---
         # These need to be owned by the main app instance so they persist
         # and can be accessed by synthesis logic. They are passed to UI modules.
@@ -529,6 +1148,7 @@ class TTSApp(tk.Tk):
         self.elevenlabs_voices: Dict[str, str] = {} # {Name: ID} map, populated by elevenlabs_ui
         # General / Playback
         self.output_file_path = tk.StringVar(self)
+        self.parallel_longform = tk.BooleanVar(self, value=False)  # Chunked long-form synthesis
         self.audio_files: Dict[str, str] = {}
         self.selected_audio_path: Optional[str] = None
         self.audio_duration: float = 0.0
@@ -537,12 +1157,12 @@ class TTSApp(tk.Tk):
         self.is_seeking: bool = False
 
         # --- Read API Keys from .env ---
-        key_prefix = "ELEVENLABS_API_KEY_"
-        for key, value in os.environ.items():
-            if key.startswith(key_prefix) and value:
-                name = key.replace(key_prefix, "")
-                if name: self.elevenlabs_api_keys[name] = value
-        logging.info(f"{len(self.elevenlabs_api_keys)} ElevenLabs keys found from .env: {list(self.elevenlabs_api_keys.keys())}")
+        self.elevenlabs_api_keys.update({
+            m.group(1): value
+            for key, value in os.environ.items()
+            if value and (m := _EL_KEY_RE.match(key))
+        })
+        logging.info("%d ElevenLabs keys found from .env: %s", len(self.elevenlabs_api_keys), list(self.elevenlabs_api_keys))
 
         # --- Create UI Elements ---
         self._create_text_context_menu()
@@ -580,6 +1200,9 @@ class TTSApp(tk.Tk):
         self.seek_slider = ttk.Scale(controls_frame, from_=0, to=100, orient=tk.HORIZONTAL, command=self.on_seek_slider_move, state=tk.DISABLED)
         self.seek_slider.grid(row=2, column=0, columnspan=3, sticky="ew", pady=(0, 5))
         self.seek_slider.bind("<ButtonPress-1>", self.on_seek_press); self.seek_slider.bind("<ButtonRelease-1>", self.on_seek_release)
+        self.seek_slider.bind("<Configure>", self._recompute_slider_step)
+        # Order matters: enable_playback_controls unpacks play/pause/stop/slider.
+        self._playback_widgets = (self.play_button, self.pause_button, self.stop_button, self.seek_slider)
 
         # --- Right Panel: Configuration and Synthesis (UNCHANGED LAYOUT) ---
         right_panel = ttk.Frame(self.paned_window)
@@ -597,49 +1220,63 @@ class TTSApp(tk.Tk):
         self.model_menu.current(0) # Default to first model
 
         # Container for Engine-Specific Parameters
+        # All engine frames are stacked in cell (0, 0); update_parameter_ui
+        # raises the active one
         self.param_frame_container = ttk.Frame(right_panel)
         self.param_frame_container.pack(fill=tk.X, pady=5, padx=5)
-
-        # --- Create Engine Parameter Frames using UI Modules ---
-        # Store the returned frames as instance variables
-        self.xtts_frame = xtts_ui.create_xtts_ui(
-            self.param_frame_container,
-            self.xtts_speaker_wav,
-            self.xtts_language,
-            self.browse_file,
-            DEFAULT_SPEAKER_DIR,
-            self.xtts_model,
-        )
-        self.piper_frame = piper_ui.create_piper_ui(
-            self.param_frame_container, self.piper_onnx_path, self.piper_json_path,
-            self.browse_file, DEFAULT_PIPER_MODEL_DIR
-        )
-        self.bark_frame = bark_ui.create_bark_ui(
-            self.param_frame_container, self.bark_voice_preset, DEFAULT_BARK_VOICES
-        )
-        self.elevenlabs_frame = elevenlabs_ui.create_elevenlabs_ui(
-            self.param_frame_container, self, # Pass app instance
-            self.selected_elevenlabs_key_name, self.elevenlabs_api_key_manual_input,
-            self.elevenlabs_voice_name, self.elevenlabs_model_id,
-            self.elevenlabs_api_keys, ELEVENLABS_MODELS
-        )
-        # Hide all frames initially; update_parameter_ui will show the correct one
-        self.xtts_frame.pack_forget()
-        self.piper_frame.pack_forget()
-        self.bark_frame.pack_forget()
-        self.elevenlabs_frame.pack_forget()
+        self.param_frame_container.grid_rowconfigure(0, weight=1)
+        self.param_frame_container.grid_columnconfigure(0, weight=1)
+
+        # --- Engine Parameter Frame Recipes ---
+        # Declarative recipe: (model name, frame attribute, factory). Frames
+        # are built lazily by _build_param_frame the first time their engine
+        # is selected — most sessions never touch all four, so the unused
+        # widget trees (and the ElevenLabs startup validation) are skipped.
+        container = self.param_frame_container
+        frame_recipes = [
+            ("XTTSv2", "xtts_frame", lambda: xtts_ui.create_xtts_ui(
+                container, self.xtts_speaker_wav, self.xtts_language,
+                self.browse_file, DEFAULT_SPEAKER_DIR, self.xtts_model)),
+            ("Piper", "piper_frame", lambda: piper_ui.create_piper_ui(
+                container, self.piper_onnx_path, self.piper_json_path,
+                self.browse_file, DEFAULT_PIPER_MODEL_DIR)),
+            ("Bark", "bark_frame", lambda: bark_ui.create_bark_ui(
+                container, self.bark_voice_preset, DEFAULT_BARK_VOICES,
+                default_preset=DEFAULT_BARK_PRESET)),
+            ("ElevenLabs", "elevenlabs_frame", lambda: elevenlabs_ui.create_elevenlabs_ui(
+                container, self,  # Pass app instance
+                self.selected_elevenlabs_key_name, self.elevenlabs_api_key_manual_input,
+                self.elevenlabs_voice_name, self.elevenlabs_model_id,
+                self.elevenlabs_api_keys, _engine("elevenlabs").ELEVENLABS_MODELS)),
+        ]
+        self._param_frames = {}
+        self._param_frame_recipes = {name: (attr, factory) for name, attr, factory in frame_recipes}
         # -------------------------------------------------------
 
         # Text Input Area
         text_frame = ttk.LabelFrame(right_panel, text="Text to Synthesize", padding="10")
         text_frame.pack(fill=tk.BOTH, expand=True, pady=5, padx=5)
-        self.text_input = scrolledtext.ScrolledText(text_frame, wrap=tk.WORD, height=10, undo=True)
+        self.text_input = scrolledtext.ScrolledText(text_frame, wrap=tk.WORD, height=10, undo=True, maxundo=200)
         self.text_input.pack(fill=tk.BOTH, expand=True)
-        self.text_input.insert(tk.END, chars='')
-        self.text_input.bind("<Button-3>", self._show_text_context_menu)
-        self.text_input.bind("<Control-a>", self._text_select_all); self.text_input.bind("<Control-A>", self._text_select_all)
-        self.text_input.bind("<Control-z>", self._text_undo); self.text_input.bind("<Control-Z>", self._text_undo)
-        self.text_input.bind("<Control-y>", self._text_redo); self.text_input.bind("<Control-Y>", self._text_redo)
+        # Ghost placeholder: a gray-tagged span that never enters the undo
+        # stack and is removed on first focus, so it cannot linger in the
+        # undo history or be synthesized by accident.
+        self.text_input.tag_configure("ghost", foreground="gray60")
+        self.text_input.insert("1.0", "Enter your text here...", "ghost")
+        self.text_input.edit_reset()
+        self.text_input.bind("<FocusIn>", self._clear_ghost_once)
+        # <<Paste>> stays widget-level on purpose: small pastes return None
+        # so the default Text class <<Paste>> binding still handles them.
+        self.text_input.bind("<<Paste>>", self._chunked_paste)
+        # Track selection state reactively: tag_ranges(SEL) walks the tag
+        # index (non-trivial for large scripts), so do it once per selection
+        # change instead of on every menu popup.
+        self.text_input.bind(
+            "<<Selection>>",
+            lambda e: setattr(self, "_sel_nonempty", bool(self.text_input.tag_ranges(tk.SEL))),
+            add="+"
+        )
+        self._install_text_bindings()
 
         # Output File Selection
         output_frame = ttk.LabelFrame(right_panel, text="Output File", padding="10")
@@ -649,16 +1286,19 @@ class TTSApp(tk.Tk):
         self.output_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
         self.browse_output_button = ttk.Button(output_frame, text="Browse...", command=self.browse_save_file)
         self.browse_output_button.pack(side=tk.LEFT, padx=5)
-        default_output_filename = os.path.join(DEFAULT_OUTPUT_DIR, "output.wav")
-        self.output_file_path.set(default_output_filename)
+        self.output_file_path.set(DEFAULT_OUTPUT_FILE)
+        # Debounced validation of the typed path (see _on_output_path_write).
+        self.output_file_path.trace_add("write", self._on_output_path_write)
 
         # Action Buttons and Status Bar
         action_frame = ttk.Frame(right_panel, padding="10")
         action_frame.pack(fill=tk.X, pady=5, padx=5)
         self.synthesize_button = ttk.Button(action_frame, text="Start Synthesis", command=self.start_synthesis_thread)
         self.synthesize_button.pack(side=tk.LEFT, padx=10, anchor=tk.N)
+        ttk.Checkbutton(action_frame, text="Chunked long-form", variable=self.parallel_longform).pack(side=tk.LEFT, anchor=tk.N)
         self.status_label = ttk.Label(action_frame, text="Ready.", anchor=tk.W)
         self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=10)
+        self._main_controls = (self.synthesize_button, self.model_menu, self.browse_output_button)
 
         # --- Final Initialization Steps ---
         self.update_parameter_ui() # Show parameters for the default model
@@ -667,12 +1307,23 @@ class TTSApp(tk.Tk):
 
         self.load_existing_audio() # Load previous audio files
 
+        # First synthesis-cache sweep runs after the initial interval; each
+        # sweep reschedules the next one.
+        self.after(_SYNTH_CACHE_SWEEP_MS, self._sweep_synth_cache)
+
         if not self.mixer_initialized:
             self.disable_playback_controls()
-            messagebox.showwarning("Audio Error", "Could not initialize audio playback.\nPlayback functions are disabled.", parent=self)
+            # Non-modal: a modal warning here would block mainloop() until
+            # dismissed. The toast appears once the window is visible and
+            # leaves the rest of the app usable.
+            self.after(500, self._show_audio_warning_toast)
 
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        # Flush the batched layout in one pass and show the finished window.
+        self.update_idletasks()
+        self.deiconify()
+
 # --- Application Entry Point ---
 if __name__ == "__main__":
     app = TTSApp()
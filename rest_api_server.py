@@ -6,21 +6,31 @@ This script creates a FastAPI server that exposes the TTS functionality
 over HTTP, allowing remote applications to use the services.
 
 Requirements:
-    pip install fastapi uvicorn python-multipart
+    pip install fastapi "uvicorn[standard]" python-multipart
 
 Usage:
     uvicorn rest_api_server:app --host 0.0.0.0 --port 8000
 """
 
 import os
+import asyncio
 import base64
+import hashlib
 import logging
-from typing import List, Dict, Optional, Any
+import re
+import shutil
+import time
+from typing import List, Dict, Optional, Any, Tuple
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+import aiofiles
+import anyio.to_thread
 from pydantic import BaseModel, Field
 import uvicorn
-import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from api.tts_api import MultiTTSAPI
 from tts_engines import elevenlabs_engine
 
@@ -34,13 +44,43 @@ logger = logging.getLogger('rest_api')
 # Create API instance
 api = MultiTTSAPI()
 
+# In production the interactive docs and OpenAPI schema are disabled;
+# generating the schema walks every route and Pydantic model, which is
+# wasted startup work on frequently restarted workers
+_IS_PROD = os.environ.get("ENV") == "prod"
+
 # Create FastAPI app
 app = FastAPI(
     title="Multi TTS Synthesizer API",
     description="REST API for synthesizing text to speech using multiple engines",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,  # Rust-based JSON serialization on every route
+    docs_url=None if _IS_PROD else "/docs",
+    redoc_url=None if _IS_PROD else "/redoc",
+    openapi_url=None if _IS_PROD else "/openapi.json"
 )
 
+
+class PathExcludedGZipMiddleware(GZipMiddleware):
+    """GZip middleware that skips audio responses.
+
+    WAV/MP3 payloads are essentially incompressible, so compressing them
+    would only burn CPU; everything else (JSON) compresses well. This
+    covers both file downloads and the chunked MP3 stream, where gzip
+    buffering would also add latency before the first chunk.
+    """
+
+    EXCLUDED_PREFIXES = ("/download/", "/synthesize/elevenlabs/stream")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(self.EXCLUDED_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+app.add_middleware(PathExcludedGZipMiddleware, minimum_size=500, compresslevel=4)
+
 # Temporary directory for files
 TEMP_DIR = "api/api_temp_files"
 os.makedirs(TEMP_DIR, exist_ok=True)
@@ -49,6 +89,10 @@ os.makedirs(TEMP_DIR, exist_ok=True)
 OUTPUT_DIR = "api/api_output"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# Generated files older than this are garbage-collected to bound disk growth
+OUTPUT_TTL_SECONDS = int(os.environ.get("OUTPUT_TTL_SECONDS", 24 * 3600))
+OUTPUT_GC_INTERVAL_SECONDS = 300
+
 
 # --- Pydantic Models ---
 
@@ -101,18 +145,209 @@ class VoicesResponse(BaseModel):
     voices: List[Dict[str, str]]
 
 
+class TaskSubmittedResponse(BaseModel):
+    task_id: str
+    status_url: str
+
+
+class TaskStatusResponse(BaseModel):
+    task_id: str
+    status: str
+    message: Optional[str] = None
+    file_url: Optional[str] = None
+
+
+# --- Piper Model Registry ---
+# Scanning the model directory once and answering lookups from memory
+# avoids two stat syscalls on every /synthesize/piper request.
+piper_models: Dict[str, Tuple[str, str]] = {}
+
+
+def refresh_piper_models() -> None:
+    """Rescan the Piper model directory into the in-memory registry."""
+    registry: Dict[str, Tuple[str, str]] = {}
+    try:
+        with os.scandir(api.DEFAULT_PIPER_MODEL_DIR) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(".onnx"):
+                    json_path = f"{entry.path}.json"
+                    if os.path.exists(json_path):
+                        registry[entry.name[:-len(".onnx")]] = (entry.path, json_path)
+    except FileNotFoundError:
+        logger.warning(f"Piper model directory not found: {api.DEFAULT_PIPER_MODEL_DIR}")
+    piper_models.clear()
+    piper_models.update(registry)
+    logger.info(f"Piper model registry loaded: {len(piper_models)} model(s)")
+
+
+def lookup_piper_model(model_name: str) -> Optional[Tuple[str, str]]:
+    """Look up a Piper model, rescanning once on a miss to pick up new files."""
+    paths = piper_models.get(model_name)
+    if paths is None:
+        refresh_piper_models()
+        paths = piper_models.get(model_name)
+    return paths
+
+
+# --- Background Task Queue ---
+# Long-running synthesis jobs can be queued instead of holding an HTTP
+# request open for the full engine run. Jobs run on a small worker pool
+# (the engines are CPU/GPU bound, so more workers would only thrash) and
+# clients poll GET /tasks/{task_id} for completion.
+#
+# NOTE: the task store lives in this process. Running uvicorn with more
+# than one worker process would make status polls land on workers that
+# never saw the task (404), so the server defaults to a single worker;
+# see the WORKERS handling in the main entry point below.
+TASK_WORKERS = int(os.environ.get("TASK_WORKERS", 2))
+task_executor = ThreadPoolExecutor(max_workers=TASK_WORKERS, thread_name_prefix="tts-task")
+tasks: Dict[str, Dict[str, Any]] = {}
+tasks_lock = threading.Lock()
+
+# Finished tasks are kept around long enough for clients to poll the final
+# status, then dropped so the store does not grow by one entry per job.
+TASK_RETENTION_S = 600
+
+
+def _prune_finished_tasks() -> None:
+    """Drop finished tasks older than the retention window. Caller holds tasks_lock."""
+    cutoff = time.monotonic() - TASK_RETENTION_S
+    stale = [
+        task_id for task_id, task in tasks.items()
+        if task.get("finished_at") is not None and task["finished_at"] < cutoff
+    ]
+    for task_id in stale:
+        del tasks[task_id]
+
+
+def _run_task(task_id: str, synthesis_func, output_path: str, **kwargs) -> None:
+    """Execute a queued synthesis job and record its outcome."""
+    with tasks_lock:
+        tasks[task_id]["status"] = "running"
+    try:
+        success, message = synthesis_func(output_path=output_path, **kwargs)
+    except Exception as e:
+        logger.error(f"Task {task_id} failed: {e}")
+        success, message = False, f"Internal error: {e}"
+
+    with tasks_lock:
+        tasks[task_id]["status"] = "done" if success else "failed"
+        tasks[task_id]["message"] = message
+        tasks[task_id]["finished_at"] = time.monotonic()
+        if success:
+            tasks[task_id]["file_url"] = f"/download/{os.path.basename(output_path)}"
+
+
+def submit_task(synthesis_func, output_path: str, **kwargs) -> Dict[str, str]:
+    """Queue a synthesis job and return its task id and polling URL."""
+    task_id = _unique_hex()
+    with tasks_lock:
+        _prune_finished_tasks()
+        tasks[task_id] = {"status": "queued", "message": None, "file_url": None, "finished_at": None}
+    task_executor.submit(_run_task, task_id, synthesis_func, output_path, **kwargs)
+    logger.info(f"Queued synthesis task {task_id}")
+    return {"task_id": task_id, "status_url": f"/tasks/{task_id}"}
+
+
 # --- Helper Functions ---
 
+# uuid.uuid4() costs a getrandom() syscall per call. Refilling a 4 KB
+# entropy buffer and handing out 16-byte slices amortizes that kernel
+# crossing ~256x on the per-request path-generation hot path.
+_RAND_REFILL = 4096
+_rand_buf = b""
+_rand_pos = _RAND_REFILL
+_rand_lock = threading.Lock()
+
+
+def _unique_hex() -> str:
+    """Return a random 32-character hex id from the buffered entropy pool."""
+    global _rand_buf, _rand_pos
+    with _rand_lock:
+        if _rand_pos + 16 > len(_rand_buf):
+            _rand_buf = os.urandom(_RAND_REFILL)
+            _rand_pos = 0
+        raw = _rand_buf[_rand_pos:_rand_pos + 16]
+        _rand_pos += 16
+    return raw.hex()
+
+
 def get_temp_path(prefix: str, suffix: str) -> str:
     """Generate a unique temporary file path."""
-    unique_id = str(uuid.uuid4())
-    return os.path.join(TEMP_DIR, f"{prefix}_{unique_id}{suffix}")
+    return os.path.join(TEMP_DIR, f"{prefix}_{_unique_hex()}{suffix}")
 
 
 def get_output_path(prefix: str) -> str:
     """Generate a unique output file path."""
-    unique_id = str(uuid.uuid4())
-    return os.path.join(OUTPUT_DIR, f"{prefix}_{unique_id}.wav")
+    return os.path.join(OUTPUT_DIR, f"{prefix}_{_unique_hex()}.wav")
+
+
+def cached_output_path(engine: str, *parts: Optional[str]) -> Tuple[str, bool]:
+    """
+    Map a synthesis request onto a content-addressed output path.
+
+    Identical requests hash to the same filename, so a repeat request can
+    return the previously generated WAV without re-running the engine.
+    BLAKE2b is used because it is the fastest hash in hashlib for this.
+
+    Returns:
+        A tuple (output_path, cached) where cached is True if the file
+        already exists.
+    """
+    h = hashlib.blake2b(engine.encode(), digest_size=16)
+    for part in parts:
+        h.update(b"\x00")
+        h.update((part or "").encode())
+    output_path = os.path.join(OUTPUT_DIR, f"{engine}_{h.hexdigest()}.wav")
+    cached = os.path.exists(output_path)
+    if cached:
+        # Refresh the mtime so frequently requested outputs survive the
+        # periodic garbage collection
+        os.utime(output_path)
+    return output_path, cached
+
+
+def _preload_engines(engines: set) -> None:
+    """Warm engine model caches so the first real request skips the cold start."""
+    from tts_engines import xtts_engine, bark_engine, piper_engine
+
+    if "xtts" in engines:
+        try:
+            xtts_engine.load_xtts_model()
+            logger.info("Preloaded XTTS model")
+        except Exception as e:
+            logger.error(f"XTTS preload failed: {e}")
+    if "bark" in engines:
+        try:
+            bark_engine.load_bark_model()
+            logger.info("Preloaded Bark model")
+        except Exception as e:
+            logger.error(f"Bark preload failed: {e}")
+    if "piper" in engines:
+        for name, (onnx_path, json_path) in piper_models.items():
+            try:
+                piper_engine.load_piper_model(onnx_path, json_path)
+                logger.info(f"Preloaded Piper model: {name}")
+            except Exception as e:
+                logger.error(f"Piper preload failed for {name}: {e}")
+
+
+async def _gc_output_loop() -> None:
+    """Periodically delete generated files older than OUTPUT_TTL_SECONDS."""
+    while True:
+        await asyncio.sleep(OUTPUT_GC_INTERVAL_SECONDS)
+        cutoff = time.time() - OUTPUT_TTL_SECONDS
+        removed = 0
+        try:
+            with os.scandir(OUTPUT_DIR) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+        except Exception as e:
+            logger.error(f"Error during output cleanup: {e}")
+        if removed:
+            logger.info(f"Output cleanup removed {removed} expired file(s)")
 
 
 def cleanup_file(file_path: str) -> None:
@@ -155,25 +390,30 @@ async def get_info():
     }
 
 
-@app.post("/synthesize/xtts", response_model=SuccessResponse, responses={400: {"model": ErrorResponse}},
-          tags=["Synthesis"])
-async def synthesize_xtts(request: XTTSRequest, background_tasks: BackgroundTasks):
+@app.post("/synthesize/xtts", responses={400: {"model": ErrorResponse}}, tags=["Synthesis"])
+def synthesize_xtts(request: XTTSRequest, background_tasks: BackgroundTasks):
     """
     Synthesize text using XTTSv2.
 
     Optionally provide a base64-encoded speaker WAV file for voice cloning.
     """
     speaker_wav_path = None
+    speaker_hash = None
 
     try:
         # Handle optional speaker WAV
         if request.speaker_wav_base64:
             try:
                 wav_data = base64.b64decode(request.speaker_wav_base64)
+                # Drop the base64 source string right away so we don't hold
+                # both encodings of the clip in memory during synthesis
+                request.speaker_wav_base64 = None
+                speaker_hash = hashlib.blake2b(wav_data, digest_size=16).hexdigest()
                 speaker_wav_path = get_temp_path("speaker", ".wav")
 
-                with open(speaker_wav_path, "wb") as f:
+                with open(speaker_wav_path, "wb", buffering=1 << 20) as f:
                     f.write(wav_data)
+                del wav_data
 
                 logger.info(f"Saved speaker WAV to {speaker_wav_path}")
                 # Schedule cleanup
@@ -181,8 +421,15 @@ async def synthesize_xtts(request: XTTSRequest, background_tasks: BackgroundTask
             except Exception as e:
                 raise HTTPException(status_code=400, detail=f"Invalid speaker WAV data: {e}")
 
-        # Generate a unique output path
-        output_path = get_output_path("xtts")
+        # Content-addressed output: identical requests reuse the existing file
+        output_path, cached = cached_output_path("xtts", request.text, request.language, speaker_hash)
+        if cached:
+            logger.info(f"Serving cached xtts output: {output_path}")
+            return {
+                "success": True,
+                "message": "Identical request served from cache.",
+                "file_url": f"/download/{os.path.basename(output_path)}"
+            }
 
         # Call the API
         success, message = api.synthesize_xtts(
@@ -210,27 +457,29 @@ async def synthesize_xtts(request: XTTSRequest, background_tasks: BackgroundTask
         raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
 
 
-@app.post("/synthesize/piper", response_model=SuccessResponse, responses={400: {"model": ErrorResponse}},
-          tags=["Synthesis"])
-async def synthesize_piper(request: PiperRequest):
+@app.post("/synthesize/piper", responses={400: {"model": ErrorResponse}}, tags=["Synthesis"])
+def synthesize_piper(request: PiperRequest):
     """
     Synthesize text using Piper.
 
     Specify a model name from the available Piper models.
     """
     try:
-        # Check if the model exists
-        model_base = os.path.join(api.DEFAULT_PIPER_MODEL_DIR, request.model_name)
-        onnx_path = f"{model_base}.onnx"
-        json_path = f"{model_base}.onnx.json"
-
-        if not os.path.exists(onnx_path):
-            raise HTTPException(status_code=400, detail=f"Piper model not found: {onnx_path}")
-        if not os.path.exists(json_path):
-            raise HTTPException(status_code=400, detail=f"Piper config not found: {json_path}")
-
-        # Generate a unique output path
-        output_path = get_output_path("piper")
+        # Look up the model in the in-memory registry
+        paths = lookup_piper_model(request.model_name)
+        if paths is None:
+            raise HTTPException(status_code=400, detail=f"Piper model not found: {request.model_name}")
+        onnx_path, json_path = paths
+
+        # Content-addressed output: identical requests reuse the existing file
+        output_path, cached = cached_output_path("piper", request.text, request.model_name)
+        if cached:
+            logger.info(f"Serving cached piper output: {output_path}")
+            return {
+                "success": True,
+                "message": "Identical request served from cache.",
+                "file_url": f"/download/{os.path.basename(output_path)}"
+            }
 
         # Call the API
         success, message = api.synthesize_piper(
@@ -258,17 +507,23 @@ async def synthesize_piper(request: PiperRequest):
         raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
 
 
-@app.post("/synthesize/bark", response_model=SuccessResponse, responses={400: {"model": ErrorResponse}},
-          tags=["Synthesis"])
-async def synthesize_bark(request: BarkRequest):
+@app.post("/synthesize/bark", responses={400: {"model": ErrorResponse}}, tags=["Synthesis"])
+def synthesize_bark(request: BarkRequest):
     """
     Synthesize text using Bark.
 
     Specify a voice preset from the available list.
     """
     try:
-        # Generate a unique output path
-        output_path = get_output_path("bark")
+        # Content-addressed output: identical requests reuse the existing file
+        output_path, cached = cached_output_path("bark", request.text, request.voice_preset, request.model_name)
+        if cached:
+            logger.info(f"Serving cached bark output: {output_path}")
+            return {
+                "success": True,
+                "message": "Identical request served from cache.",
+                "file_url": f"/download/{os.path.basename(output_path)}"
+            }
 
         # Call the API
         success, message = api.synthesize_bark(
@@ -296,8 +551,8 @@ async def synthesize_bark(request: BarkRequest):
         raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
 
 
-@app.post("/synthesize/elevenlabs", response_model=SuccessResponse, responses={400: {"model": ErrorResponse}}, tags=["Synthesis"])
-async def synthesize_elevenlabs(request: ElevenLabsRequest):
+@app.post("/synthesize/elevenlabs", responses={400: {"model": ErrorResponse}}, tags=["Synthesis"])
+def synthesize_elevenlabs(request: ElevenLabsRequest):
     """
     Synthesize text using ElevenLabs.
 
@@ -308,8 +563,15 @@ async def synthesize_elevenlabs(request: ElevenLabsRequest):
         if not api.validate_elevenlabs_key(request.api_key):
             raise HTTPException(status_code=400, detail="Invalid ElevenLabs API key")
 
-        # Generate a unique output path
-        output_path = get_output_path("elevenlabs")
+        # Content-addressed output: identical requests reuse the existing file
+        output_path, cached = cached_output_path("elevenlabs", request.text, request.voice_id, request.model_id)
+        if cached:
+            logger.info(f"Serving cached elevenlabs output: {output_path}")
+            return {
+                "success": True,
+                "message": "Identical request served from cache.",
+                "file_url": f"/download/{os.path.basename(output_path)}"
+            }
 
         # Call the API
         success, message = api.synthesize_elevenlabs(
@@ -337,8 +599,33 @@ async def synthesize_elevenlabs(request: ElevenLabsRequest):
         logger.error(f"Error in elevenlabs synthesis: {e}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
 
+@app.post("/synthesize/elevenlabs/stream", responses={400: {"model": ErrorResponse}}, tags=["Synthesis"])
+def synthesize_elevenlabs_stream(request: ElevenLabsRequest):
+    """
+    Stream synthesized ElevenLabs audio as it is generated.
+
+    Audio is returned as chunked MP3 directly from the engine, so playback
+    can start at time-to-first-byte instead of after the full synthesis and
+    a second download round-trip. Nothing is written to disk.
+    """
+    if not api.validate_elevenlabs_key(request.api_key):
+        raise HTTPException(status_code=400, detail="Invalid ElevenLabs API key")
+
+    try:
+        chunks = elevenlabs_engine.stream_elevenlabs(
+            api_key=request.api_key,
+            text=request.text,
+            voice_id=request.voice_id,
+            model_id=request.model_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(chunks, media_type="audio/mpeg")
+
+
 @app.post("/elevenlabs/voices", response_model=VoicesResponse, responses={400: {"model": ErrorResponse}}, tags=["ElevenLabs"])
-async def get_elevenlabs_voices(request: ElevenLabsVoiceRequest):
+def get_elevenlabs_voices(request: ElevenLabsVoiceRequest):
     """
     Get available ElevenLabs voices.
 
@@ -362,25 +649,123 @@ async def get_elevenlabs_voices(request: ElevenLabsVoiceRequest):
         logger.error(f"Error fetching ElevenLabs voices: {e}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {e}")
 
+@app.post("/synthesize/xtts/queue", response_model=TaskSubmittedResponse, tags=["Tasks"])
+def queue_xtts(request: XTTSRequest):
+    """Queue an XTTSv2 synthesis job and return a task id for polling."""
+    speaker_wav_path = None
+    if request.speaker_wav_base64:
+        try:
+            wav_data = base64.b64decode(request.speaker_wav_base64)
+            request.speaker_wav_base64 = None
+            speaker_wav_path = get_temp_path("speaker", ".wav")
+            with open(speaker_wav_path, "wb", buffering=1 << 20) as f:
+                f.write(wav_data)
+            del wav_data
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Invalid speaker WAV data: {e}")
+
+    return submit_task(
+        api.synthesize_xtts,
+        output_path=get_output_path("xtts"),
+        text=request.text,
+        language=request.language,
+        speaker_wav_path=speaker_wav_path
+    )
+
+
+@app.post("/synthesize/piper/queue", response_model=TaskSubmittedResponse, tags=["Tasks"])
+def queue_piper(request: PiperRequest):
+    """Queue a Piper synthesis job and return a task id for polling."""
+    paths = lookup_piper_model(request.model_name)
+    if paths is None:
+        raise HTTPException(status_code=400, detail=f"Piper model not found: {request.model_name}")
+    onnx_path, json_path = paths
+
+    return submit_task(
+        api.synthesize_piper,
+        output_path=get_output_path("piper"),
+        text=request.text,
+        model_onnx_path=onnx_path,
+        model_json_path=json_path
+    )
+
+
+@app.post("/synthesize/bark/queue", response_model=TaskSubmittedResponse, tags=["Tasks"])
+def queue_bark(request: BarkRequest):
+    """Queue a Bark synthesis job and return a task id for polling."""
+    return submit_task(
+        api.synthesize_bark,
+        output_path=get_output_path("bark"),
+        text=request.text,
+        voice_preset=request.voice_preset,
+        model_name=request.model_name
+    )
+
+
+@app.post("/synthesize/elevenlabs/queue", response_model=TaskSubmittedResponse, tags=["Tasks"])
+def queue_elevenlabs(request: ElevenLabsRequest):
+    """Queue an ElevenLabs synthesis job and return a task id for polling."""
+    if not api.validate_elevenlabs_key(request.api_key):
+        raise HTTPException(status_code=400, detail="Invalid ElevenLabs API key")
+
+    return submit_task(
+        api.synthesize_elevenlabs,
+        output_path=get_output_path("elevenlabs"),
+        text=request.text,
+        voice_id=request.voice_id,
+        model_id=request.model_id,
+        api_key=request.api_key
+    )
+
+
+@app.get("/tasks/{task_id}", response_model=TaskStatusResponse, tags=["Tasks"])
+def get_task_status(task_id: str):
+    """Get the status of a queued synthesis task."""
+    with tasks_lock:
+        task = tasks.get(task_id)
+        if task is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+        return {
+            "task_id": task_id,
+            "status": task["status"],
+            "message": task["message"],
+            "file_url": task["file_url"]
+        }
+
+
+# Matches the names produced by get_output_path / cached_output_path
+# (plus the MP3 fallback the ElevenLabs engine can leave behind); anything
+# else is rejected before we touch the filesystem
+_DOWNLOAD_FILENAME_RE = re.compile(r"^[A-Za-z0-9_-]{1,128}\.(wav|mp3)$")
+
+
 @app.get("/download/{filename}", tags=["Download"])
-async def download_file(filename: str):
+def download_file(filename: str):
     """
     Download a generated audio file.
 
     The filename should be obtained from a previous synthesis response.
     """
+    # A single precompiled match both blocks traversal attempts and keeps
+    # the sendfile fast path free of per-request path normalization
+    if not _DOWNLOAD_FILENAME_RE.match(filename):
+        raise HTTPException(status_code=400, detail="Invalid filename")
+
     file_path = os.path.join(OUTPUT_DIR, filename)
 
     if not os.path.exists(file_path):
         raise HTTPException(status_code=404, detail="File not found")
 
+    # FileResponse streams via sendfile(2) where the server supports it;
+    # advertise byte ranges so clients can resume large WAV downloads
     return FileResponse(
         path=file_path,
         filename=filename,
-        media_type="audio/wav"
+        media_type="audio/wav",
+        headers={"Accept-Ranges": "bytes"}
     )
 
-@app.post("/synthesize/xtts/upload", response_model=SuccessResponse, responses={400: {"model": ErrorResponse}}, tags=["Synthesis"])
+@app.post("/synthesize/xtts/upload", responses={400: {"model": ErrorResponse}}, tags=["Synthesis"])
 async def synthesize_xtts_with_upload(
     text: str = Form(...),
     language: str = Form("en"),
@@ -400,8 +785,12 @@ async def synthesize_xtts_with_upload(
             try:
                 speaker_wav_path = get_temp_path("speaker", ".wav")
 
-                with open(speaker_wav_path, "wb") as f:
-                    f.write(await speaker_wav.read())
+                # Copy the upload in 1 MB chunks so peak memory stays
+                # bounded regardless of the clip size; aiofiles keeps the
+                # disk writes off the event loop in this async handler
+                async with aiofiles.open(speaker_wav_path, "wb") as f:
+                    while chunk := await speaker_wav.read(1 << 20):
+                        await f.write(chunk)
 
                 logger.info(f"Saved uploaded speaker WAV to {speaker_wav_path}")
                 # Schedule cleanup
@@ -413,8 +802,10 @@ async def synthesize_xtts_with_upload(
         # Generate a unique output path
         output_path = get_output_path("xtts")
 
-        # Call the API
-        success, message = api.synthesize_xtts(
+        # Call the API in the threadpool so the blocking synthesis
+        # does not stall the event loop of this async handler
+        success, message = await run_in_threadpool(
+            api.synthesize_xtts,
             text=text,
             language=language,
             speaker_wav_path=speaker_wav_path,
@@ -443,25 +834,44 @@ async def startup_event():
     """Initialize resources on startup."""
     logger.info("Starting Multi TTS API Server")
 
-    # Ensure directories exist
-    os.makedirs(TEMP_DIR, exist_ok=True)
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    # Synthesis handlers are plain `def` and run in the default threadpool;
+    # lift the default 40-thread ceiling so slow engine calls don't starve
+    # the quick endpoints
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 200
 
-    # Cleanup any old temporary files
+    # Wipe leftover temp files in one recursive delete instead of one
+    # unlink syscall per file, then recreate the directory
     try:
-        for filename in os.listdir(TEMP_DIR):
-            file_path = os.path.join(TEMP_DIR, filename)
-            if os.path.isfile(file_path):
-                os.remove(file_path)
+        shutil.rmtree(TEMP_DIR, ignore_errors=True)
         logger.info("Cleaned up temporary files")
-    except Exception as e:
-        logger.error(f"Error cleaning up temporary files: {e}")
+    finally:
+        os.makedirs(TEMP_DIR, exist_ok=True)
+
+    # Ensure the output directory exists
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    # Build the Piper model registry so request handlers skip path checks
+    refresh_piper_models()
+
+    # Start the periodic garbage collection of generated output files
+    app.state.gc_task = asyncio.create_task(_gc_output_loop())
+
+    # Optionally warm engine model caches in this worker so the first
+    # request doesn't pay a multi-second model load, e.g.
+    # PRELOAD_ENGINES=xtts,bark,piper
+    preload = {name.strip() for name in os.environ.get("PRELOAD_ENGINES", "").split(",") if name.strip()}
+    if preload:
+        asyncio.create_task(asyncio.to_thread(_preload_engines, preload))
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources on shutdown."""
     logger.info("Shutting down Multi TTS API Server")
 
+    gc_task = getattr(app.state, "gc_task", None)
+    if gc_task:
+        gc_task.cancel()
+
 # --- Main Entry Point ---
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
@@ -473,4 +883,17 @@ if __name__ == "__main__":
     print(f"Alternative API docs: http://{host}:{port}/redoc")
     print(f"Press Ctrl+C to stop the server")
 
-    uvicorn.run(app, host=host, port=port)
\ No newline at end of file
+    # One worker process by default: the /queue task store and the loaded
+    # engine models live in process memory, so with multiple workers a
+    # status poll can land on a worker that never saw the task (404).
+    # WORKERS>1 is only safe for the stateless synchronous endpoints, and
+    # each extra worker loads its own copy of every engine model.
+    workers = int(os.environ.get("WORKERS", 1))
+    if workers > 1:
+        print("WARNING: WORKERS>1 breaks /tasks polling of queued jobs (per-process task store)")
+    print(f"Worker processes: {workers}")
+
+    # Use the C-based event loop (uvloop) and HTTP parser (httptools) from
+    # uvicorn[standard]; both cut per-request ASGI overhead noticeably on
+    # this mostly I/O-bound API. Fails loud at startup if they are missing.
+    uvicorn.run("rest_api_server:app", host=host, port=port, loop="uvloop", http="httptools", workers=workers)
\ No newline at end of file
@@ -10,6 +10,7 @@ Requires 'elevenlabs' and 'httpx'. Conversion optionally uses 'pydub'.
 import os
 import time
 import logging
+from dataclasses import dataclass
 from typing import Optional, List, Tuple, Dict, Any
 
 # Official ElevenLabs client library
@@ -26,12 +27,32 @@ logger = logging.getLogger(__name__) # Logger specific to this module
 
 # --- Constants ---
 # Common ElevenLabs model IDs. Check ElevenLabs docs for the latest.
-ELEVENLABS_MODELS: List[str] = [
+# A tuple rather than a list: the set of models is fixed for a session, and
+# an immutable constant cannot be invalidated by accidental mutation.
+ELEVENLABS_MODELS: Tuple[str, ...] = (
     "eleven_multilingual_v2",  # Recommended default, supports multiple languages
     "eleven_multilingual_v1",
     "eleven_monolingual_v1",   # Primarily for English
     # "eleven_turbo_v2"      # Lower latency option if needed
-]
+)
+
+# --- Client Pool ---
+# The ElevenLabs client wraps an httpx client with keep-alive connections.
+# Reusing one client per API key keeps TCP+TLS sessions open across calls
+# instead of paying a fresh handshake for every validate/fetch/synthesize.
+_client_pool: Dict[str, ElevenLabs] = {}
+
+def _get_client(api_key: str) -> ElevenLabs:
+    """Return a pooled ElevenLabs client for the given API key."""
+    client = _client_pool.get(api_key)
+    if client is None:
+        client = ElevenLabs(api_key=api_key)
+        _client_pool[api_key] = client
+    return client
+
+def _drop_client(api_key: str) -> None:
+    """Remove a client from the pool (e.g. after its key failed validation)."""
+    _client_pool.pop(api_key, None)
 
 # --- API Interaction Functions ---
 
@@ -51,8 +72,8 @@ def validate_api_key(api_key_to_validate: Optional[str]) -> Optional[str]:
 
     logger.info("Validating ElevenLabs API key...")
     try:
-        # Create a temporary client with the provided key for validation purposes
-        client = ElevenLabs(api_key=api_key_to_validate)
+        # Reuse the pooled client for this key
+        client = _get_client(api_key_to_validate)
         # Perform a lightweight API call to check if the key is valid
         client.models.get_all()
         logger.info("ElevenLabs API key validated successfully.")
@@ -62,10 +83,12 @@ def validate_api_key(api_key_to_validate: Optional[str]) -> Optional[str]:
         logger.error(
             f"API key validation failed: HTTP Status {http_err.response.status_code}. Check the key."
         )
+        _drop_client(api_key_to_validate)
         return None
     except Exception as e:
         # Catch other potential errors during client creation or API call
         logger.error(f"API key validation failed: {e}", exc_info=False) # Log less verbosely
+        _drop_client(api_key_to_validate)
         return None
 
 def get_elevenlabs_voices(api_key: Optional[str]) -> List[Tuple[str, str]]:
@@ -88,8 +111,8 @@ def get_elevenlabs_voices(api_key: Optional[str]) -> List[Tuple[str, str]]:
 
     logger.info("Fetching ElevenLabs voices...")
     try:
-        # Create the client using the provided (presumably validated) API key
-        client = ElevenLabs(api_key=api_key)
+        # Reuse the pooled client for this (presumably validated) API key
+        client = _get_client(api_key)
         voice_list = client.voices.get_all().voices
 
         # Format the response into a more usable list of (name, id) tuples
@@ -132,7 +155,7 @@ def get_subscription_info(api_key: Optional[str]) -> Dict[str, Any]:
 
     logger.info("Fetching ElevenLabs subscription info...")
     try:
-        client = ElevenLabs(api_key=api_key)
+        client = _get_client(api_key)
         sub_info_obj = client.user.get_subscription()  # Correcte aanroep
 
         # --- GEBRUIK PYDANTIC CONVERSIE ---
@@ -180,6 +203,45 @@ def get_subscription_info(api_key: Optional[str]) -> Dict[str, Any]:
         logger.error(f"Error fetching subscription info: {e}", exc_info=True)
         raise RuntimeError(f"Could not fetch subscription info: {e}")
 
+# No slots=True: dataclass slots need Python 3.10 and the project documents
+# 3.8+ as supported.
+@dataclass(frozen=True)
+class Credits:
+    """Character-quota snapshot with a ready-to-display summary string.
+
+    The parsing and string formatting happen once, in whatever worker thread
+    fetched the data; UI code can show ``display`` directly without doing any
+    dict lookups or f-string work on its own (main) thread.
+    """
+    character_count: int
+    character_limit: int
+    remaining: int
+    percentage_used: float
+    display: str
+
+def get_credits(api_key: Optional[str]) -> Credits:
+    """
+    Fetches the subscription info and condenses it into a Credits snapshot.
+
+    Args:
+        api_key: The validated ElevenLabs API key.
+
+    Returns:
+        A Credits instance with numeric fields and a preformatted 'display'
+        string suitable for a status label.
+
+    Raises:
+        ValueError: If the API key is missing.
+        RuntimeError: If fetching subscription info fails.
+    """
+    info = get_subscription_info(api_key)
+    used = int(info.get("character_count") or 0)
+    limit = int(info.get("character_limit") or 0)
+    remaining = max(limit - used, 0)
+    percentage = (used / limit * 100.0) if limit else 0.0
+    display = f"Credits: {remaining:,} / {limit:,} characters remaining ({percentage:.1f}% used)"
+    return Credits(used, limit, remaining, percentage, display)
+
 def _parse_elevenlabs_error_details(response: httpx.Response) -> str:
     """Attempts to extract a user-friendly error message from an ElevenLabs error response."""
     try:
@@ -195,6 +257,50 @@ def _parse_elevenlabs_error_details(response: httpx.Response) -> str:
         else: return response.text
     except Exception: return response.text # Fallback on JSON parsing error
 
+def stream_elevenlabs(
+    api_key: Optional[str],
+    text: str,
+    voice_id: str,
+    model_id: str
+):
+    """
+    Streams synthesized audio from ElevenLabs as MP3 chunks.
+
+    Unlike synthesize_elevenlabs this does not touch the filesystem: chunks
+    are yielded as they arrive from the API, so a caller can forward them to
+    a client while synthesis is still running.
+
+    Args:
+        api_key: The validated ElevenLabs API key.
+        text: The text to synthesize.
+        voice_id: The ID of the voice to use.
+        model_id: The ID of the model to use.
+
+    Returns:
+        An iterator over MP3 audio chunks (bytes).
+
+    Raises:
+        ValueError: If any required argument is missing.
+    """
+    # Deliberately a plain function, not a generator: validation and the API
+    # call must happen when the caller invokes us, so errors raise here
+    # instead of surfacing mid-stream after a response has already started.
+    if not api_key: raise ValueError("API key is required for ElevenLabs synthesis.")
+    if not voice_id: raise ValueError("No ElevenLabs voice ID selected.")
+    if not model_id: raise ValueError("No ElevenLabs model ID selected.")
+    if not text or not text.strip(): raise ValueError("No text entered for synthesis.")
+
+    logger.info(f"Starting ElevenLabs streaming synthesis: Voice={voice_id}, Model={model_id}")
+    client = _get_client(api_key)
+    audio_stream = client.generate(text=text, voice=Voice(voice_id=voice_id), model=model_id, stream=True)
+
+    def _chunks():
+        for chunk in audio_stream:
+            if chunk:
+                yield chunk
+
+    return _chunks()
+
 def synthesize_elevenlabs(
     api_key: Optional[str],
     text: str,
@@ -234,7 +340,7 @@ def synthesize_elevenlabs(
             os.makedirs(output_dir); logger.info(f"Output directory created: {output_dir}")
 
         # --- API Call ---
-        client = ElevenLabs(api_key=api_key)
+        client = _get_client(api_key)
         audio_data = client.generate(text=text, voice=Voice(voice_id=voice_id), model=model_id)
 
         # --- Save as MP3 ---
@@ -2,13 +2,18 @@
 import time
 import os
 import wave
+from collections import OrderedDict
 from piper.voice import PiperVoice
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-# Globale cache voor geladen Piper stemmen
-loaded_voices = {} # key = onnx_path, value = voice object
+# Globale LRU-cache voor geladen Piper stemmen. Elke voice houdt zijn eigen
+# onnxruntime sessie vast, dus herhaalde synthese met hetzelfde model slaat
+# de sessie-opbouw volledig over; de bovengrens voorkomt dat het wisselen
+# tussen veel stemmen onbeperkt geheugen vasthoudt.
+MAX_LOADED_VOICES = 3
+loaded_voices = OrderedDict() # key = onnx_path, value = voice object
 
 def load_piper_model(onnx_path, json_path, force_reload=False):
     """Laadt een Piper stem model (indien nog niet geladen)."""
@@ -21,6 +26,7 @@ def load_piper_model(onnx_path, json_path, force_reload=False):
 
     if cache_key in loaded_voices and not force_reload:
         logging.info(f"Piper model {onnx_path} al geladen.")
+        loaded_voices.move_to_end(cache_key) # Meest recent gebruikt
         return loaded_voices[cache_key]
 
     if not os.path.exists(onnx_path):
@@ -39,6 +45,10 @@ def load_piper_model(onnx_path, json_path, force_reload=False):
             raise AttributeError("voice.config of voice.config.sample_rate ontbreekt!")
 
         loaded_voices[cache_key] = voice
+        # Oudste stem eruit zodra de cache zijn bovengrens overschrijdt
+        while len(loaded_voices) > MAX_LOADED_VOICES:
+            evicted_path, _ = loaded_voices.popitem(last=False)
+            logging.info(f"Piper model {evicted_path} uit cache verwijderd (LRU).")
         return voice
     except Exception as e:
         logging.error(f"FOUT bij laden Piper model {onnx_path}: {e}", exc_info=True)
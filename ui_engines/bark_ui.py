@@ -3,7 +3,7 @@ import tkinter as tk
 from tkinter import ttk
 import logging
 
-def create_bark_ui(parent, voice_preset_var, bark_voices_list):
+def create_bark_ui(parent, voice_preset_var, bark_voices_list, default_preset=None):
     """
     Creates the parameter frame specific to the Bark engine.
 
@@ -11,6 +11,9 @@ def create_bark_ui(parent, voice_preset_var, bark_voices_list):
         parent: The parent widget (ttk.Frame) to place this UI in.
         voice_preset_var: tk.StringVar for the selected voice preset.
         bark_voices_list: List of available Bark voice presets.
+        default_preset: Preset to preselect; resolved by the caller so the
+            membership check is not repeated here. Falls back to the first
+            list entry when not given.
 
     Returns:
         The created ttk.LabelFrame containing the Bark parameters.
@@ -23,8 +26,7 @@ def create_bark_ui(parent, voice_preset_var, bark_voices_list):
 
     # Set a default voice preset safely
     if bark_voices_list:
-        default_preset = "v2/en_speaker_6" # A common English preset
-        voice_preset_var.set(default_preset if default_preset in bark_voices_list else bark_voices_list[0])
+        voice_preset_var.set(default_preset or bark_voices_list[0])
     else:
         logging.warning("[Bark UI] BARK_VOICES list is empty! Cannot set default.")
 
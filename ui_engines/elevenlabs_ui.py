@@ -1,8 +1,12 @@
 # ui_engines/elevenlabs_ui.py
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
+import hashlib
+import json
+import os
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Tuple, Dict
 
 # Import the engine functions ONLY NEEDED for validation/fetching within this UI module
@@ -22,33 +26,133 @@ _voice_dropdown = None
 _api_key_entry = None
 _key_selector = None
 
+# Recently validated keys, stored as {blake2b(key): monotonic timestamp}.
+# Toggling between dropdown keys within the TTL skips the HTTPS round-trip
+# (and never keeps the plaintext key in the cache itself).
+_VALIDATION_TTL = 600  # seconds
+_validation_cache: Dict[str, float] = {}
+
+def _key_hash(api_key: str) -> str:
+    return hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+
+# Shared pool for validation/voices network calls. A bounded pool reuses its
+# threads across repeated key selections (no per-call spawn cost) and caps
+# concurrent ElevenLabs requests so a click burst cannot trigger 429s.
+_io_pool: Optional[ThreadPoolExecutor] = None
+
+def _submit_io(fn, *args) -> None:
+    """Submits a network-bound task to the (lazily created) shared pool."""
+    global _io_pool
+    if _io_pool is None:
+        _io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tts-io")
+    _io_pool.submit(fn, *args)
+
+def shutdown_io_pool() -> None:
+    """Shuts down the shared I/O pool; called from the app's close handler."""
+    global _io_pool
+    if _io_pool is not None:
+        _io_pool.shutdown(wait=False)
+        _io_pool = None
+
+# The voice list is considered fresh for this long; opening the dropdown
+# after the TTL triggers a background refresh (see _on_voice_dropdown_open).
+_VOICES_TTL = 300  # seconds
+_voices_fresh_at = 0.0
+
+# Voice list persisted across launches: the dropdown is filled from this
+# file immediately at UI creation, so voices appear before (and without)
+# the network round-trip. Refreshed on every successful fetch.
+_VOICES_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "MultiTTSApp")
+_VOICES_CACHE_FILE = os.path.join(_VOICES_CACHE_DIR, "voices.json")
+
+def _load_cached_voices() -> Optional[List[Tuple[str, str]]]:
+    """Returns the voice list persisted by the last successful fetch."""
+    try:
+        with open(_VOICES_CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return [(str(name), str(voice_id)) for name, voice_id in data]
+    except (OSError, ValueError):
+        return None
+
+def _store_cached_voices(voices: List[Tuple[str, str]]) -> None:
+    """Atomically persists the fetched voice list for the next launch."""
+    try:
+        os.makedirs(_VOICES_CACHE_DIR, exist_ok=True)
+        tmp_path = _VOICES_CACHE_FILE + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(voices, f)
+        os.replace(tmp_path, _VOICES_CACHE_FILE)
+    except OSError as e:
+        logging.warning("Could not persist ElevenLabs voices cache: %s", e)
+
+def _batch_config(updates):
+    """Applies a list of (widget, options) pairs in one sweep.
+
+    Each widget gets exactly one configure() call (one Tcl invocation) with
+    all its option changes merged, instead of separate config() calls per
+    option. Widgets that are still None are skipped.
+    """
+    for widget, options in updates:
+        if widget is not None:
+            widget.configure(**options)
+
 # --- Helper Functions specific to ElevenLabs UI ---
 
-def _set_active_elevenlabs_key(app_instance, key_to_set: Optional[str]) -> bool:
-    """Validates the given key using the engine and updates UI state."""
-    global _refresh_voices_button, _voice_dropdown
+def _set_active_elevenlabs_key(app_instance, key_to_set: Optional[str]) -> None:
+    """Starts validating the given key in a background thread.
+
+    The HTTPS validation round-trip must not run on the Tk main thread, so
+    the actual network call happens in a worker and the UI state is updated
+    afterwards via app_instance.after (same pattern as the voices fetch).
+    """
     if not elevenlabs_engine:
         app_instance.update_status("ElevenLabs engine module not loaded.", clear_after=10)
-        return False
+        return
+
+    # Fresh cache hit: apply the success path immediately, no network call
+    if key_to_set:
+        validated_at = _validation_cache.get(_key_hash(key_to_set))
+        if validated_at is not None and time.monotonic() - validated_at < _VALIDATION_TTL:
+            logging.info("[EL UI] Key validation served from cache.")
+            _apply_key_validation_result(app_instance, key_to_set)
+            return
 
     app_instance.update_status(f"Validating ElevenLabs API key...")
+    _submit_io(_validate_key_worker, app_instance, key_to_set)
+
+def _validate_key_worker(app_instance, key_to_set: Optional[str]):
+    """Worker function (runs in thread) to validate an API key."""
     validated_key = elevenlabs_engine.validate_api_key(key_to_set)
+    if validated_key:
+        _validation_cache[_key_hash(validated_key)] = time.monotonic()
+    elif key_to_set:
+        _validation_cache.pop(_key_hash(key_to_set), None)
+    # Schedule the UI update back on the main thread
+    app_instance.after(0, _apply_key_validation_result, app_instance, validated_key)
+
+def _apply_key_validation_result(app_instance, validated_key: Optional[str]) -> bool:
+    """Applies the outcome of a key validation in the main GUI thread."""
+    global _refresh_voices_button, _voice_dropdown
 
     if validated_key:
         app_instance.current_elevenlabs_key = validated_key # Store the validated key in app instance
         app_instance.update_status("ElevenLabs API key validated successfully.", clear_after=5)
         # Enable the refresh button now that we have a valid key
         if _refresh_voices_button: _refresh_voices_button.config(state=tk.NORMAL)
-        # Automatically fetch voices after successful validation
-        refresh_elevenlabs_voices_thread(app_instance) # Pass app_instance
+        # Automatically fetch voices after successful validation. Deferred to
+        # the next event-loop tick so the validated state paints before the
+        # fetch fan-out starts.
+        app_instance.after(0, refresh_elevenlabs_voices_thread, app_instance)
         return True
     else:
         app_instance.current_elevenlabs_key = None # Clear the active key in app instance
         app_instance.update_status("ElevenLabs API key validation failed.", clear_after=10)
-        # Disable voice-related controls
-        if _refresh_voices_button: _refresh_voices_button.config(state=tk.DISABLED)
+        # Disable voice-related controls in one batch
+        _batch_config([
+            (_refresh_voices_button, {"state": tk.DISABLED}),
+            (_voice_dropdown, {"state": tk.DISABLED, "values": []}),
+        ])
         if _voice_dropdown:
-            _voice_dropdown.config(state=tk.DISABLED, values=[])
             app_instance.elevenlabs_voice_name.set("") # Update the app's StringVar
         if hasattr(app_instance, 'elevenlabs_voices'):
             app_instance.elevenlabs_voices.clear() # Clear internal voice mapping in app instance
@@ -62,13 +166,13 @@ def on_key_selected(event, app_instance, key_name_var, manual_key_var):
     selected_name = key_name_var.get()
     if selected_name in app_instance.elevenlabs_api_keys:
         selected_key = app_instance.elevenlabs_api_keys[selected_name]
-        logging.info(f"[EL UI] Selected key '{selected_name}' from dropdown.")
+        logging.info("[EL UI] Selected key '%s' from dropdown.", selected_name)
         # Clear the manual input field if a dropdown key is chosen
         if _api_key_entry: manual_key_var.set("")
         # Validate and set this key as the active one
         _set_active_elevenlabs_key(app_instance, selected_key)
     else:
-        logging.warning(f"[EL UI] Selected key name '{selected_name}' not found in loaded keys.")
+        logging.warning("[EL UI] Selected key name '%s' not found in loaded keys.", selected_name)
 
 def use_manual_key(app_instance, manual_key_var, key_name_var):
     """Handles the 'Use This' button for the manually entered API key."""
@@ -97,13 +201,8 @@ def refresh_elevenlabs_voices_thread(app_instance):
     app_instance.update_status("Fetching ElevenLabs voices...")
     # Disable button during refresh
     if _refresh_voices_button: _refresh_voices_button.config(state=tk.DISABLED)
-    # Pass the active key to the worker thread
-    thread = threading.Thread(
-        target=_get_voices_worker,
-        args=(app_instance, app_instance.current_elevenlabs_key), # Pass app_instance and key
-        daemon=True
-    )
-    thread.start()
+    # Pass the active key to the worker
+    _submit_io(_get_voices_worker, app_instance, app_instance.current_elevenlabs_key)
 
 def _get_voices_worker(app_instance, api_key: str):
     """Worker function (runs in thread) to fetch voices using the provided key."""
@@ -117,39 +216,59 @@ def _get_voices_worker(app_instance, api_key: str):
     try:
         # Call the engine function with the validated API key
         voices_result = elevenlabs_engine.get_elevenlabs_voices(api_key)
+        # Still on the worker thread: persist for instant population on
+        # the next launch.
+        if voices_result:
+            _store_cached_voices(voices_result)
     except Exception as e:
         error = e
-        logging.error(f"[EL UI] Error in _get_voices_worker thread: {e}", exc_info=True)
+        logging.error("[EL UI] Error in _get_voices_worker thread: %s", e, exc_info=True)
     # Schedule the UI update back on the main thread using app_instance.after
     app_instance.after(0, _update_elevenlabs_voice_list, app_instance, voices_result, error)
 
-def _update_elevenlabs_voice_list(app_instance, voices_result: Optional[List[Tuple[str, str]]], error: Optional[Exception]):
+def _on_voice_dropdown_open(app_instance):
+    """postcommand for the voice dropdown: refreshes a stale list on open.
+
+    Tk invokes this only when the user actually opens the dropdown, so the
+    staleness check (and any resulting network fetch) is paid on demand
+    instead of on a timer.
+    """
+    if not app_instance.current_elevenlabs_key: return
+    if time.monotonic() - _voices_fresh_at < _VOICES_TTL: return
+    refresh_elevenlabs_voices_thread(app_instance)
+
+def _update_elevenlabs_voice_list(app_instance, voices_result: Optional[List[Tuple[str, str]]], error: Optional[Exception], from_cache: bool = False):
     """Updates the voice dropdown list in the main GUI thread."""
-    global _refresh_voices_button, _voice_dropdown
+    global _refresh_voices_button, _voice_dropdown, _voices_fresh_at
     # Re-enable refresh button only if a key is currently considered valid
-    if _refresh_voices_button:
-        new_state = tk.NORMAL if app_instance.current_elevenlabs_key else tk.DISABLED
-        _refresh_voices_button.config(state=new_state)
+    refresh_state = tk.NORMAL if app_instance.current_elevenlabs_key else tk.DISABLED
 
     # Handle errors first
     if error:
         app_instance.update_status(f"Error fetching voices: {error}", clear_after=10)
         messagebox.showerror("Error Fetching Voices", f"Could not fetch ElevenLabs voices:\n{error}", parent=app_instance)
-        # Reset voice list UI elements
+        # Reset voice list UI elements in one batch
+        _batch_config([
+            (_refresh_voices_button, {"state": refresh_state}),
+            (_voice_dropdown, {"state": tk.DISABLED, "values": []}),
+        ])
         if _voice_dropdown:
-             _voice_dropdown.config(state=tk.DISABLED, values=[])
              app_instance.elevenlabs_voice_name.set("") # Update app's variable
         if hasattr(app_instance, 'elevenlabs_voices'):
              app_instance.elevenlabs_voices.clear() # Update app's voice map
         return
 
+    if _refresh_voices_button: _refresh_voices_button.config(state=refresh_state)
+
     # Process successful results
     if voices_result is not None and hasattr(app_instance, 'elevenlabs_voices'):
+        # Disk-cached lists stay "stale" so the next dropdown open refreshes.
+        if not from_cache: _voices_fresh_at = time.monotonic()
+        # One pass: the dict constructor consumes the (name, id) tuples
+        # directly and the names fall out of the mapping's insertion order.
         app_instance.elevenlabs_voices.clear() # Clear previous mapping in app instance
-        voice_names = []
-        for name, voice_id in voices_result:
-            app_instance.elevenlabs_voices[name] = voice_id # Store name -> ID map in app instance
-            voice_names.append(name)
+        app_instance.elevenlabs_voices.update(voices_result)
+        voice_names = list(app_instance.elevenlabs_voices)
 
         if _voice_dropdown:
             _voice_dropdown.config(values=voice_names, state="readonly" if voice_names else "disabled")
@@ -200,7 +319,7 @@ def create_elevenlabs_ui(parent, app_instance, key_name_var, manual_key_var, voi
     key_select_frame = ttk.Frame(elevenlabs_frame)
     key_select_frame.pack(fill=tk.X, pady=5)
     ttk.Label(key_select_frame, text="Select Key (.env):").pack(side=tk.LEFT, padx=(0, 5))
-    key_names = list(api_keys_dict.keys())
+    key_names = list(api_keys_dict)
     _key_selector = ttk.Combobox(
         key_select_frame,
         textvariable=key_name_var,
@@ -235,7 +354,8 @@ def create_elevenlabs_ui(parent, app_instance, key_name_var, manual_key_var, voi
         voice_frame,
         textvariable=voice_name_var, # Use the variable from app_instance
         state="disabled",
-        width=38
+        width=38,
+        postcommand=lambda: _on_voice_dropdown_open(app_instance)
     )
     _voice_dropdown.pack(side=tk.LEFT, fill=tk.X, expand=True)
     _refresh_voices_button = ttk.Button(
@@ -260,12 +380,20 @@ def create_elevenlabs_ui(parent, app_instance, key_name_var, manual_key_var, voi
     # Set a default model if the list is not empty
     if elevenlabs_models_list: model_id_var.set(elevenlabs_models_list[0])
 
+    # --- Populate Voices from Disk Cache ---
+    # Show last session's voices immediately; a successful validation below
+    # triggers a fresh fetch that overwrites both the dropdown and the cache.
+    cached_voices = _load_cached_voices()
+    if cached_voices:
+        logging.info("[EL UI] Populating %d voices from disk cache.", len(cached_voices))
+        _update_elevenlabs_voice_list(app_instance, cached_voices, None, from_cache=True)
+
     # --- Initial Setup Attempt ---
     # Try to validate the first key from .env if available on creation
-    if key_names:
-        first_key_name = key_names[0]
+    if api_keys_dict:
+        first_key_name = next(iter(api_keys_dict))
         first_key = api_keys_dict[first_key_name]
-        logging.info(f"[EL UI] Attempting initial setup with key '{first_key_name}'")
+        logging.info("[EL UI] Attempting initial setup with key '%s'", first_key_name)
         # Use app_instance.after to ensure this runs after the main loop starts
         # and doesn't block UI creation. Schedule the validation.
         app_instance.after(100, lambda: _set_active_elevenlabs_key(app_instance, first_key))
@@ -4,15 +4,22 @@ from tkinter import ttk
 import os
 import logging
 
-# Import the engine to get available models
-try:
-    from tts_engines import xtts_engine
-
-    XTTS_ENGINE_AVAILABLE = True
-except ImportError:
-    XTTS_ENGINE_AVAILABLE = False
-    logging.warning("XTTS engine not available for UI model list")
-    xtts_engine = None
+# The XTTS engine pulls in TTS/torch, which dominates cold-start time.
+# Import it on first use so merely importing this UI module stays cheap.
+_xtts_engine = None
+_engine_checked = False
+
+def _get_engine():
+    """Returns tts_engines.xtts_engine, importing it on first use (None if unavailable)."""
+    global _xtts_engine, _engine_checked
+    if not _engine_checked:
+        _engine_checked = True
+        try:
+            from tts_engines import xtts_engine
+            _xtts_engine = xtts_engine
+        except ImportError:
+            logging.warning("XTTS engine not available for UI model list")
+    return _xtts_engine
 
 
 def create_xtts_ui(parent, speaker_wav_var, language_var, browse_callback, default_speaker_dir, model_var=None):
@@ -33,9 +40,10 @@ def create_xtts_ui(parent, speaker_wav_var, language_var, browse_callback, defau
     xtts_frame = ttk.LabelFrame(parent, text="TTS Engine Parameters", padding="10")
 
     current_row = 0
+    xtts_engine = _get_engine()
 
     # Model Selection with Categories
-    if model_var is not None and hasattr(model_var, 'set') and XTTS_ENGINE_AVAILABLE:
+    if model_var is not None and hasattr(model_var, 'set') and xtts_engine:
         ttk.Label(xtts_frame, text="Model:").grid(row=current_row, column=0, padx=5, pady=5, sticky=tk.W)
 
         try:
@@ -86,7 +94,7 @@ def create_xtts_ui(parent, speaker_wav_var, language_var, browse_callback, defau
                     selected = model_combo.get()
                     if selected.startswith("────") or not selected.strip():
                         # Reset to previous valid selection or default
-                        default_key = "xtts_v2" if "xtts_v2" in all_models else list(all_models.keys())[0]
+                        default_key = "xtts_v2" if "xtts_v2" in all_models else next(iter(all_models))
                         default_display = next(
                             (display for display, key in model_mapping.items() if key == default_key), None)
                         if default_display:
@@ -101,7 +109,7 @@ def create_xtts_ui(parent, speaker_wav_var, language_var, browse_callback, defau
                 model_combo._all_models = all_models
 
                 # Set default selection
-                default_key = "xtts_v2" if "xtts_v2" in all_models else list(all_models.keys())[0]
+                default_key = "xtts_v2" if "xtts_v2" in all_models else next(iter(all_models))
                 default_display = next((display for display, key in model_mapping.items() if key == default_key), None)
                 if default_display:
                     model_var.set(default_display)
@@ -163,7 +171,7 @@ def create_xtts_ui(parent, speaker_wav_var, language_var, browse_callback, defau
     def update_language_options(model_key):
         """Update language options based on selected model."""
         try:
-            if XTTS_ENGINE_AVAILABLE and xtts_engine:
+            if xtts_engine:
                 languages = xtts_engine.get_model_languages(model_key)
                 if languages:
                     # Create language display with codes and names
@@ -294,7 +302,8 @@ def get_selected_model_key(model_var, xtts_frame=None):
             return xtts_frame._model_mapping.get(selected_display, "xtts_v2")
 
         # Fallback: try engine directly
-        if XTTS_ENGINE_AVAILABLE and xtts_engine:
+        xtts_engine = _get_engine()
+        if xtts_engine:
             available_models = xtts_engine.get_available_models()
             for key, info in available_models.items():
                 if info['name'] in selected_display: